@@ -2,14 +2,12 @@
 
 from __future__ import annotations
 
-import json
 import sys
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Protocol
 
 import click
 import typer
-from rich.syntax import Syntax
 
 import org.config.app
 import org.logging
@@ -20,10 +18,10 @@ from org.pipeline.format import (
     OutputOperation,
     PreparedOutput,
     _build_org_document,
-    _json_output_payload,
-    _normalize_syntax_theme,
+    _org_document_renderable,
     _org_to_pandoc_format,
     _parse_pandoc_args,
+    _prepare_json_output,
     _prepare_output,
     print_prepared_output,
 )
@@ -123,44 +121,33 @@ class TasksListOutputFormatter(Protocol):
 
 def _format_short_task_list(data: TasksListRenderInput) -> str:
     """Return formatted short list of tasks."""
-    lines = [
-        format_task_line(
-            node,
-            TaskLineConfig(
-                color_enabled=data.color_enabled,
-                done_states=data.done_states,
-                todo_states=data.todo_states,
-                line_width=data.line_width,
-            ),
-        )
-        for node in data.nodes
-    ]
-    return lines_to_text(lines)
+    config = TaskLineConfig(
+        color_enabled=data.color_enabled,
+        done_states=data.done_states,
+        todo_states=data.todo_states,
+        line_width=data.line_width,
+    )
+    return lines_to_text([format_task_line(node, config) for node in data.nodes])
+
+
+def _format_detailed_task_block(node: Heading) -> str:
+    """Build org-formatted text block for one detailed task."""
+    filename = node.document.filename or "unknown"
+    node_text = str(node).rstrip()
+    return f"# {filename}\n{node_text}" if node_text else f"# {filename}"
 
 
 def _prepare_detailed_task_list(nodes: list[Heading], out_theme: str) -> PreparedOutput:
-    """Prepare detailed list of tasks with syntax highlighting."""
-    theme = _normalize_syntax_theme(out_theme)
-    operations: list[OutputOperation] = []
-    for idx, node in enumerate(nodes):
-        if idx > 0:
-            operations.append(OutputOperation(kind="console_print", text="", markup=False))
-        filename = node.document.filename or "unknown"
-        node_text = str(node).rstrip()
-        org_block = f"# {filename}\n{node_text}" if node_text else f"# {filename}"
-        operations.append(
+    """Prepare detailed list of tasks as one syntax-highlighted org document."""
+    org_text = "\n\n".join(_format_detailed_task_block(node) for node in nodes)
+    return PreparedOutput(
+        operations=(
             OutputOperation(
                 kind="console_print",
-                renderable=Syntax(
-                    org_block,
-                    "org",
-                    theme=theme,
-                    line_numbers=False,
-                    word_wrap=True,
-                ),
+                renderable=_org_document_renderable(org_text, out_theme),
             ),
-        )
-    return PreparedOutput(operations=tuple(operations))
+        ),
+    )
 
 
 class OrgTasksListOutputFormatter:
@@ -230,13 +217,7 @@ class JsonTasksListOutputFormatter:
 
     def prepare(self, data: TasksListRenderInput) -> PreparedOutput:
         """Prepare tasks list output as JSON."""
-        payload = _json_output_payload(list(data.nodes))
-        return _prepare_output(
-            json.dumps(payload, ensure_ascii=True),
-            data.color_enabled,
-            OutputFormat.JSON,
-            data.out_theme,
-        )
+        return _prepare_json_output(list(data.nodes), data.color_enabled, data.out_theme)
 
 
 _ORG_TASKS_LIST_FORMATTER = OrgTasksListOutputFormatter()
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Protocol, cast
 
@@ -13,7 +12,6 @@ from org_parser.document import Heading
 from org_parser.element import Element
 from org_parser.text import RichText
 from org_parser.time import Timestamp
-from rich.syntax import Syntax
 
 import org.config.app
 import org.logging
@@ -24,10 +22,10 @@ from org.pipeline.format import (
     OutputOperation,
     PreparedOutput,
     _build_org_document,
-    _json_output_payload,
-    _normalize_syntax_theme,
+    _org_document_renderable,
     _org_to_pandoc_format,
     _parse_pandoc_args,
+    _prepare_json_output,
     _prepare_output,
     print_prepared_output,
 )
@@ -55,9 +53,12 @@ class QueryOutputFormatter(Protocol):
         ...
 
 
+_ORG_OUTPUT_TYPES = (Heading, Document, Element, Timestamp, RichText)
+
+
 def _is_org_object(value: object) -> bool:
     """Return whether value is an org-parser object rendered as org output."""
-    return isinstance(value, Heading | Document | Element | Timestamp | RichText)
+    return isinstance(value, _ORG_OUTPUT_TYPES)
 
 
 def _format_org_block(value: object) -> str:
@@ -104,33 +105,19 @@ class OrgQueryOutputFormatter:
                 ),
             )
 
-        return _prepare_output(
-            json.dumps(_json_output_payload(values), ensure_ascii=True),
-            color_enabled,
-            OutputFormat.JSON,
-            out_theme,
-        )
+        return _prepare_json_output(values, color_enabled, out_theme)
 
     def _prepare_org_values(self, values: list[object], out_theme: str) -> PreparedOutput:
-        """Prepare org values using org-mode syntax highlighting."""
-        theme = _normalize_syntax_theme(out_theme)
-        operations: list[OutputOperation] = []
-        for idx, value in enumerate(values):
-            if idx > 0:
-                operations.append(OutputOperation(kind="console_print", text="", markup=False))
-            operations.append(
+        """Prepare org values as one document using org-mode syntax highlighting."""
+        org_text = "\n\n".join(_format_org_block(value) for value in values)
+        return PreparedOutput(
+            operations=(
                 OutputOperation(
                     kind="console_print",
-                    renderable=Syntax(
-                        _format_org_block(value),
-                        "org",
-                        theme=theme,
-                        line_numbers=False,
-                        word_wrap=True,
-                    ),
+                    renderable=_org_document_renderable(org_text, out_theme),
                 ),
-            )
-        return PreparedOutput(operations=tuple(operations))
+            ),
+        )
 
 
 class PandocQueryOutputFormatter:
@@ -176,12 +163,7 @@ class JsonQueryOutputFormatter:
     ) -> PreparedOutput:
         """Prepare query values as JSON output."""
         del console
-        return _prepare_output(
-            json.dumps(_json_output_payload(values), ensure_ascii=True),
-            color_enabled,
-            OutputFormat.JSON,
-            out_theme,
-        )
+        return _prepare_json_output(values, color_enabled, out_theme)
 
 
 _ORG_QUERY_FORMATTER = OrgQueryOutputFormatter()
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import dataclasses
+import json
 import logging
 import shlex
 import subprocess
@@ -10,7 +11,9 @@ from collections.abc import Iterable, Mapping
 from dataclasses import dataclass
 from datetime import date, datetime, time
 from enum import StrEnum
-from typing import TYPE_CHECKING, cast
+from functools import lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING
 
 from org_parser import Document
 from org_parser.document import Heading
@@ -18,12 +21,15 @@ from org_parser.element import Element, Properties, Repeat
 from org_parser.text import RichText
 from org_parser.time import Clock, Timestamp
 from rich.syntax import Syntax
+from rich.text import Text
 
 from org.logic.stats import AnalysisResult, Distribution, Group, Tag, TimeRange
 from org.tui.bits import print_output
 
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from rich.console import Console
 
 
@@ -31,41 +37,45 @@ logger = logging.getLogger("org")
 
 DEFAULT_OUTPUT_THEME = "github-dark"
 
-
-_RENDERABLE_OUTPUT_FORMATS: dict[str, str] = {
-    "bibtex": "bibtex",
-    "commonmark": "markdown",
-    "commonmark_x": "markdown",
-    "docbook": "xml",
-    "docbook4": "xml",
-    "docbook5": "xml",
-    "gfm": "markdown",
-    "haddock": "markdown",
-    "html": "html",
-    "html4": "html",
-    "html5": "html",
-    "jats": "xml",
-    "jats_archiving": "xml",
-    "jats_articleauthoring": "xml",
-    "jats_publishing": "xml",
-    "json": "json",
-    "latex": "latex",
-    "man": "man",
-    "markdown": "markdown",
-    "markdown_github": "markdown",
-    "markdown_mmd": "markdown",
-    "markdown_phpextra": "markdown",
-    "markdown_strict": "markdown",
-    "mediawiki": "mediawiki",
-    "ms": "ms",
-    "org": "org",
-    "rst": "rst",
-    "tei": "xml",
-    "textile": "textile",
-    "typst": "typst",
-    "xwiki": "mediawiki",
-    "zimwiki": "mediawiki",
-}
+_HIGHLIGHT_MAX_CHARS = 262_144
+
+
+_RENDERABLE_OUTPUT_FORMATS: MappingProxyType[str, str] = MappingProxyType(
+    {
+        "bibtex": "bibtex",
+        "commonmark": "markdown",
+        "commonmark_x": "markdown",
+        "docbook": "xml",
+        "docbook4": "xml",
+        "docbook5": "xml",
+        "gfm": "markdown",
+        "haddock": "markdown",
+        "html": "html",
+        "html4": "html",
+        "html5": "html",
+        "jats": "xml",
+        "jats_archiving": "xml",
+        "jats_articleauthoring": "xml",
+        "jats_publishing": "xml",
+        "json": "json",
+        "latex": "latex",
+        "man": "man",
+        "markdown": "markdown",
+        "markdown_github": "markdown",
+        "markdown_mmd": "markdown",
+        "markdown_phpextra": "markdown",
+        "markdown_strict": "markdown",
+        "mediawiki": "mediawiki",
+        "ms": "ms",
+        "org": "org",
+        "rst": "rst",
+        "tei": "xml",
+        "textile": "textile",
+        "typst": "typst",
+        "xwiki": "mediawiki",
+        "zimwiki": "mediawiki",
+    },
+)
 
 
 class OutputFormat(StrEnum):
@@ -82,6 +92,7 @@ class OutputOperation:
     kind: str
     text: str | None = None
     data: bytes | None = None
+    payload: object | None = None
     renderable: object | None = None
     markup: bool = False
     color_enabled: bool = False
@@ -99,9 +110,9 @@ class OutputFormatError(RuntimeError):
     """Raised when output formatting fails."""
 
 
-def _write_plain_output(console: Console, text: str) -> None:
-    """Write plain output directly to console stream."""
-    console.file.write(f"{text}\n")
+def _write_plain_output(console: Console, texts: list[str]) -> None:
+    """Write a run of plain output lines to console stream with one write and flush."""
+    console.file.write("\n".join(texts) + "\n")
     console.file.flush()
 
 
@@ -115,38 +126,70 @@ def _write_binary_output(console: Console, data: bytes) -> None:
     raise OutputFormatError("binary output is not supported by the active console stream")
 
 
+def _write_json_output(console: Console, payload: object) -> None:
+    """Serialize JSON payload directly into console stream."""
+    json.dump(payload, console.file, ensure_ascii=True, check_circular=False)
+    console.file.write("\n")
+    console.file.flush()
+
+
+def _print_binary_operation(console: Console, operation: OutputOperation) -> None:
+    """Print one binary write operation."""
+    if operation.data is not None:
+        _write_binary_output(console, operation.data)
+
+
+def _print_json_operation(console: Console, operation: OutputOperation) -> None:
+    """Print one JSON write operation."""
+    _write_json_output(console, operation.payload)
+
+
+def _print_output_operation(console: Console, operation: OutputOperation) -> None:
+    """Print one unwrapped text operation."""
+    if operation.text is not None:
+        print_output(console, operation.text, operation.color_enabled, end=operation.end)
+
+
+def _print_console_operation(console: Console, operation: OutputOperation) -> None:
+    """Print one renderable or text operation through the console."""
+    if operation.renderable is not None:
+        console.print(operation.renderable)
+        return
+    console.print(operation.text if operation.text is not None else "", markup=operation.markup)
+
+
+_OPERATION_PRINTERS: dict[str, Callable[[Console, OutputOperation], None]] = {
+    "binary_write": _print_binary_operation,
+    "json_write": _print_json_operation,
+    "print_output": _print_output_operation,
+    "console_print": _print_console_operation,
+}
+
+
 def print_prepared_output(console: Console, prepared_output: PreparedOutput) -> None:
     """Print already prepared output operations."""
+    pending_plain: list[str] = []
     for operation in prepared_output.operations:
         if operation.kind == "plain_write":
             if operation.text is not None:
-                _write_plain_output(console, operation.text)
-            continue
-        if operation.kind == "binary_write":
-            if operation.data is not None:
-                _write_binary_output(console, operation.data)
-            continue
-        if operation.kind == "print_output":
-            if operation.text is not None:
-                print_output(
-                    console,
-                    operation.text,
-                    operation.color_enabled,
-                    end=operation.end,
-                )
-            continue
-        if operation.renderable is not None:
-            console.print(operation.renderable)
+                pending_plain.append(operation.text)
             continue
-        console.print(operation.text if operation.text is not None else "", markup=operation.markup)
+        if pending_plain:
+            _write_plain_output(console, pending_plain)
+            pending_plain = []
+        _OPERATION_PRINTERS.get(operation.kind, _print_console_operation)(console, operation)
+    if pending_plain:
+        _write_plain_output(console, pending_plain)
 
 
+@lru_cache(maxsize=64)
 def _resolve_syntax_language(output_format: str) -> str | None:
     """Resolve output format to a syntax highlighter language alias."""
     normalized_output = output_format.strip().lower()
     return _RENDERABLE_OUTPUT_FORMATS.get(normalized_output)
 
 
+@lru_cache(maxsize=64)
 def _normalize_syntax_theme(out_theme: str) -> str:
     """Return a valid theme name for syntax rendering."""
     normalized_theme = out_theme.strip()
@@ -170,7 +213,7 @@ def _prepare_output(
     else:
         text = value
 
-    if color_enabled:
+    if color_enabled and len(text) <= _HIGHLIGHT_MAX_CHARS:
         language = _resolve_syntax_language(output_format)
         if language is not None:
             return PreparedOutput(
@@ -190,9 +233,44 @@ def _prepare_output(
     return PreparedOutput(operations=(OutputOperation(kind="plain_write", text=text),))
 
 
+def _org_document_renderable(org_text: str, out_theme: str) -> Syntax | Text:
+    """Return org syntax highlighting renderable, or plain text for oversized documents."""
+    if len(org_text) > _HIGHLIGHT_MAX_CHARS:
+        return Text(org_text)
+    return Syntax(
+        org_text,
+        "org",
+        theme=_normalize_syntax_theme(out_theme),
+        line_numbers=False,
+        word_wrap=True,
+    )
+
+
+def _prepare_json_output(
+    values: list[object],
+    color_enabled: bool,
+    out_theme: str,
+) -> PreparedOutput:
+    """Prepare JSON output, streaming the payload when no highlighting is needed."""
+    payload = _json_output_payload(values)
+    if color_enabled:
+        return _prepare_output(
+            json.dumps(payload, ensure_ascii=True, check_circular=False),
+            color_enabled,
+            OutputFormat.JSON,
+            out_theme,
+        )
+    return PreparedOutput(operations=(OutputOperation(kind="json_write", payload=payload),))
+
+
+_ORG_DOCUMENT_TYPES = (Heading, Document)
+
+
 def _to_org_input_text(value: object) -> str:
     """Convert arbitrary query value into org text for markdown conversion."""
-    if isinstance(value, Heading | Document):
+    if isinstance(value, str):
+        return value
+    if isinstance(value, _ORG_DOCUMENT_TYPES):
         return str(value)
     if value is None:
         return "null"
@@ -203,9 +281,8 @@ def _to_org_input_text(value: object) -> str:
 
 def _build_org_document(values: list[object]) -> str:
     """Build one org document from all output values."""
-    parts = [_to_org_input_text(value) for value in values]
-    non_empty_parts = [part for part in parts if part]
-    return "\n".join(non_empty_parts)
+    parts = (_to_org_input_text(value) for value in values)
+    return "\n".join(part for part in parts if part)
 
 
 def _parse_pandoc_args(pandoc_args: str | None) -> list[str]:
@@ -231,6 +308,9 @@ def _org_to_pandoc_format(org_text: str, output_format: str, pandoc_args: list[s
     except (OSError, ValueError) as exc:
         raise OutputFormatError(str(exc)) from exc
 
+    if result.returncode == 0 and not result.stderr:
+        return result.stdout
+
     stderr_text = result.stderr.decode("utf-8", errors="replace").strip()
     if result.returncode != 0:
         message = stderr_text or f"pandoc failed with exit code {result.returncode}"
@@ -303,14 +383,42 @@ _REPEAT_EXPORTED_FIELDS = (
     "timestamp",
 )
 
+type JsonSeenObjects = dict[int, tuple[object, object]]
+
+_JSON_PRIMITIVE_TYPES = frozenset({str, int, float, bool, type(None)})
+_JSON_SCALAR_TYPES = (bool, int, float, str)
+_TEMPORAL_TYPES = (datetime, date, time)
+_COLLECTION_TYPES = (list, tuple, set, frozenset)
+_ORG_VALUE_TYPES = (Timestamp, Clock, Repeat)
+_ORG_NODE_TYPES = (Heading, Document, Element)
+_ANALYSIS_TYPES = (AnalysisResult, Tag, Group, TimeRange, Distribution)
+
+_EXPORTED_FIELDS_BY_TYPE: dict[type, tuple[str, ...]] = {
+    Document: _ROOT_EXPORTED_FIELDS,
+    Heading: _NODE_EXPORTED_FIELDS,
+    Timestamp: _TIMESTAMP_EXPORTED_FIELDS,
+    Clock: _CLOCK_EXPORTED_FIELDS,
+    Repeat: _REPEAT_EXPORTED_FIELDS,
+}
+
 
 def _is_primitive_json_type(value: object) -> bool:
     """Return whether the value maps directly to a JSON primitive."""
-    return value is None or isinstance(value, bool | int | float | str)
+    return value is None or isinstance(value, _JSON_SCALAR_TYPES)
 
 
 def _exported_org_fields(value: object) -> tuple[str, ...]:
-    """Return explicit exported field names for each org object type."""
+    """Return exported field names for an org object, cached per concrete type."""
+    value_type = type(value)
+    exported_fields = _EXPORTED_FIELDS_BY_TYPE.get(value_type)
+    if exported_fields is None:
+        exported_fields = _resolve_exported_org_fields(value)
+        _EXPORTED_FIELDS_BY_TYPE[value_type] = exported_fields
+    return exported_fields
+
+
+def _resolve_exported_org_fields(value: object) -> tuple[str, ...]:
+    """Return explicit exported field names, or public attribute names for generic elements."""
     if isinstance(value, Document):
         return _ROOT_EXPORTED_FIELDS
     if isinstance(value, Heading):
@@ -321,39 +429,26 @@ def _exported_org_fields(value: object) -> tuple[str, ...]:
         return _CLOCK_EXPORTED_FIELDS
     if isinstance(value, Repeat):
         return _REPEAT_EXPORTED_FIELDS
-    return _element_exported_fields(cast("Element", value))
+    return tuple(sorted(name for name in dir(type(value)) if not name.startswith("_")))
 
 
-def _element_exported_fields(value: Element) -> tuple[str, ...]:
-    """Return serializable public fields for generic Element values."""
-    exported_fields: list[str] = []
-    for field_name in dir(value):
-        if field_name.startswith("_"):
-            continue
+def _org_object_to_json_dict(value: object, seen: JsonSeenObjects) -> dict[str, object]:
+    """Serialize org object public attributes into a JSON object."""
+    data: dict[str, object] = {"type": type(value).__name__}
+    for field_name in _exported_org_fields(value):
         try:
             field_value = getattr(value, field_name)
         except Exception:  # noqa: BLE001
             continue
         if callable(field_value):
             continue
-        exported_fields.append(field_name)
-    return tuple(sorted(exported_fields))
-
-
-def _org_object_to_json_dict(value: object, seen: set[int]) -> dict[str, object]:
-    """Serialize org object public attributes into a JSON object."""
-    data: dict[str, object] = {"type": type(value).__name__}
-    for field_name in _exported_org_fields(value):
-        if not hasattr(value, field_name):
-            continue
-        field_value = getattr(value, field_name)
         data[field_name] = _to_json_compatible(field_value, seen)
     return data
 
 
 def _analysis_object_to_json_dict(
     value: AnalysisResult | Tag | Group | TimeRange | Distribution,
-    seen: set[int],
+    seen: JsonSeenObjects,
 ) -> dict[str, object]:
     """Serialize analysis result dataclass into a JSON object with a type field."""
     data: dict[str, object] = {"type": type(value).__name__}
@@ -362,55 +457,65 @@ def _analysis_object_to_json_dict(
     return data
 
 
-def _iterable_to_json_list(value: object, seen: set[int]) -> list[object]:
+def _iterable_to_json_list(value: Iterable[object], seen: JsonSeenObjects) -> list[object]:
     """Convert iterable values into JSON arrays."""
-    if isinstance(value, Iterable):
-        return [_to_json_compatible(item, seen) for item in value]
-    return [str(value)]
+    return [_to_json_compatible(item, seen) for item in value]
 
 
-def _to_json_compatible(value: object, seen: set[int] | None = None) -> object:  # noqa: C901
+def _to_json_compatible(value: object, seen: JsonSeenObjects | None = None) -> object:
     """Convert arbitrary values to JSON-serializable structures."""
-    if _is_primitive_json_type(value):
+    if type(value) in _JSON_PRIMITIVE_TYPES or _is_primitive_json_type(value):
         return value
     if isinstance(value, RichText):
         return value.text
+    if isinstance(value, _TEMPORAL_TYPES):
+        return value.isoformat()
+    if isinstance(value, bytes):
+        return value.decode("utf-8", errors="replace")
 
     if seen is None:
-        seen = set()
+        seen = {}
+    return _object_to_json(value, seen)
 
+
+def _object_to_json(value: object, seen: JsonSeenObjects) -> object:
+    """Convert container and object values while guarding against cycles."""
     obj_id = id(value)
-    if obj_id in seen:
-        return None
+    visited = seen.get(obj_id)
+    if visited is not None:
+        return visited[1]
+    # Visited objects stay pinned so their ids cannot be reused mid-conversion. Containers map
+    # to None, which breaks cycles; immutable value objects map to their converted result.
+    seen[obj_id] = (value, None)
 
     result: object
-    if isinstance(value, datetime | date | time):
-        result = value.isoformat()
-    elif isinstance(value, bytes):
-        result = value.decode("utf-8", errors="replace")
+    if isinstance(value, _COLLECTION_TYPES):
+        result = _iterable_to_json_list(value, seen)
     elif isinstance(value, Properties):
-        seen.add(obj_id)
         result = {str(key): _to_json_compatible(item, seen) for key, item in value.items()}
-    elif isinstance(value, Timestamp | Clock | Repeat | Heading | Document | Element):
-        seen.add(obj_id)
+    elif isinstance(value, _ORG_VALUE_TYPES):
+        result = _org_object_to_json_dict(value, seen)
+        seen[obj_id] = (value, result)
+    elif isinstance(value, _ORG_NODE_TYPES):
         result = _org_object_to_json_dict(value, seen)
-    elif isinstance(value, AnalysisResult | Tag | Group | TimeRange | Distribution):
-        seen.add(obj_id)
+    elif isinstance(value, _ANALYSIS_TYPES):
         result = _analysis_object_to_json_dict(value, seen)
     elif isinstance(value, Mapping):
-        seen.add(obj_id)
         result = {str(key): _to_json_compatible(item, seen) for key, item in value.items()}
     elif isinstance(value, Iterable):
-        seen.add(obj_id)
         result = _iterable_to_json_list(value, seen)
     else:
         result = str(value)
+        seen[obj_id] = (value, result)
     return result
 
 
 def _json_output_payload(values: list[object]) -> object:
     """Convert formatter values to final JSON payload shape."""
-    converted = [_to_json_compatible(value) for value in values]
+    converted = [
+        value if type(value) in _JSON_PRIMITIVE_TYPES else _to_json_compatible(value)
+        for value in values
+    ]
     if len(converted) == 1:
         return converted[0]
     return converted
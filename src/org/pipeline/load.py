@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import logging
 import sys
+from itertools import chain
 from pathlib import Path
 from typing import TYPE_CHECKING, Protocol, cast
 
@@ -25,6 +26,8 @@ from org.query.runner import run_query
 
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from org_parser.document import Document
 
     from org.config.app import AppConfig
@@ -63,7 +66,7 @@ def _prepend_todo_config(contents: str, todo_states: list[str], done_states: lis
     return todo_config + contents
 
 
-def _merge_state_order(existing: list[str], discovered: list[str]) -> list[str]:
+def _merge_state_order(existing: list[str], discovered: Iterable[str]) -> list[str]:
     """Merge discovered states into existing list while preserving order."""
     merged = list(existing)
     seen = set(merged)
@@ -82,17 +85,12 @@ def load_root_nodes(
 ) -> tuple[list[Document], list[str], list[str]]:
     """Load org-mode files and return root nodes with merged todo/done keys."""
     roots: list[Document] = []
-    all_todo_states = list(todo_states)
-    all_done_states = list(done_states)
-
     for name in filenames:
         contents = _read_org_file(name)
         contents = _prepend_todo_config(contents, todo_states, done_states)
-        root = loads(contents, filename=name)
-        all_todo_states = _merge_state_order(all_todo_states, list(root.todo_states))
-        all_done_states = _merge_state_order(all_done_states, list(root.done_states))
-        roots.append(root)
+        roots.append(loads(contents, filename=name))
 
+    all_todo_states, all_done_states = resolve_loaded_state_context(roots, todo_states, done_states)
     return roots, all_todo_states, all_done_states
 
 
@@ -119,11 +117,14 @@ def resolve_loaded_state_context(
     done_states: list[str],
 ) -> tuple[list[str], list[str]]:
     """Merge discovered todo and done states from loaded documents."""
-    all_todo_states = list(todo_states)
-    all_done_states = list(done_states)
-    for document in documents:
-        all_todo_states = _merge_state_order(all_todo_states, list(document.todo_states))
-        all_done_states = _merge_state_order(all_done_states, list(document.done_states))
+    all_todo_states = _merge_state_order(
+        todo_states,
+        chain.from_iterable(document.todo_states for document in documents),
+    )
+    all_done_states = _merge_state_order(
+        done_states,
+        chain.from_iterable(document.done_states for document in documents),
+    )
     return all_todo_states, all_done_states
 
 
@@ -3,9 +3,33 @@
 from __future__ import annotations
 
 from collections.abc import Callable
-from typing import TYPE_CHECKING
+from functools import lru_cache
+from typing import TYPE_CHECKING, cast
 
-from org.query.engine.interpreter import EvalContext, Stream, evaluate_expr
+from org.query.engine.ast import (
+    BinaryOp,
+    BoolLiteral,
+    FieldAccess,
+    FunctionCall,
+    Group,
+    Iterate,
+    NumberLiteral,
+    Pipe,
+    Sequence,
+    StringLiteral,
+)
+from org.query.engine.interpreter import (
+    ARG_FUNCTIONS,
+    NO_ARG_FUNCTIONS,
+    EvalContext,
+    Stream,
+    binary_operator_handler,
+    broadcast,
+    evaluate_boolean_operator,
+    evaluate_expr,
+    iterate_values,
+    resolve_field,
+)
 from org.query.engine.parser import parse_query
 
 
@@ -14,10 +38,142 @@ if TYPE_CHECKING:
 
 
 type CompiledQuery = Callable[[Stream, EvalContext], Stream]
+type ExprCompiler = Callable[[Expr], CompiledQuery]
 
 
 def compile_expr(expr: Expr) -> CompiledQuery:
-    """Compile expression into executable query callable."""
+    """Compile expression into executable query callable specialized for its structure."""
+    compiler = _EXPR_COMPILERS.get(type(expr))
+    if compiler is None:
+        return _compile_evaluated(expr)
+    return compiler(expr)
+
+
+def _compile_group(expr: Group) -> CompiledQuery:
+    """Compile parenthesized expression to its inner expression."""
+    return compile_expr(expr.expr)
+
+
+def _compile_pipe(expr: Pipe) -> CompiledQuery:
+    """Compile pipe feeding left results into the right expression."""
+    left = compile_expr(expr.left)
+    right = compile_expr(expr.right)
+
+    def _compiled(stream: Stream, context: EvalContext) -> Stream:
+        return right(left(stream, context), context)
+
+    return _compiled
+
+
+def _compile_sequence(expr: Sequence) -> CompiledQuery:
+    """Compile sequence evaluating first for side effects and returning second."""
+    first = compile_expr(expr.first)
+    second = compile_expr(expr.second)
+
+    def _compiled(stream: Stream, context: EvalContext) -> Stream:
+        first(stream, context)
+        return second(stream, context)
+
+    return _compiled
+
+
+def _compile_field_access(expr: FieldAccess) -> CompiledQuery:
+    """Compile field access with the field name bound at compile time."""
+    base = compile_expr(expr.base)
+    field = expr.field
+
+    def _compiled(stream: Stream, context: EvalContext) -> Stream:
+        return [resolve_field(value, field) for value in base(stream, context)]
+
+    return _compiled
+
+
+def _compile_iterate(expr: Iterate) -> CompiledQuery:
+    """Compile iteration over compiled base results."""
+    base = compile_expr(expr.base)
+
+    def _compiled(stream: Stream, context: EvalContext) -> Stream:
+        return iterate_values(base(stream, context))
+
+    return _compiled
+
+
+def _compile_literal(expr: NumberLiteral | StringLiteral | BoolLiteral) -> CompiledQuery:
+    """Compile literal into a callable producing its constant value."""
+    value = expr.value
+
+    def _compiled(stream: Stream, context: EvalContext) -> Stream:
+        del stream, context
+        return [value]
+
+    return _compiled
+
+
+def _compile_binary_op(expr: BinaryOp) -> CompiledQuery:
+    """Compile binary operation over compiled operands."""
+    if expr.operator in {"and", "or"}:
+        return _compile_boolean_op(expr)
+    handler = binary_operator_handler(expr.operator)
+    left = compile_expr(expr.left)
+    right = compile_expr(expr.right)
+
+    def _compiled(stream: Stream, context: EvalContext) -> Stream:
+        pairs = broadcast(left(stream, context), right(stream, context))
+        return [handler(lhs, rhs) for lhs, rhs in pairs]
+
+    return _compiled
+
+
+def _compile_boolean_op(expr: BinaryOp) -> CompiledQuery:
+    """Compile and/or evaluating the right operand only when the left does not decide."""
+    operator = expr.operator
+    left = compile_expr(expr.left)
+    right = compile_expr(expr.right)
+
+    def _compiled(stream: Stream, context: EvalContext) -> Stream:
+        return evaluate_boolean_operator(operator, left, right, stream, context)
+
+    return _compiled
+
+
+def _compile_function_call(expr: FunctionCall) -> CompiledQuery:
+    """Compile built-in function call with its implementation resolved once."""
+    argument = expr.argument
+    if argument is None:
+        no_arg_function = NO_ARG_FUNCTIONS.get(expr.name)
+        if no_arg_function is not None:
+            return _compile_no_arg_function(no_arg_function)
+    else:
+        arg_function = ARG_FUNCTIONS.get(expr.name)
+        if arg_function is not None:
+            return _compile_arg_function(arg_function, argument)
+    return _compile_evaluated(expr)
+
+
+def _compile_no_arg_function(function: Callable[[Stream], Stream]) -> CompiledQuery:
+    """Compile call to a built-in function without arguments."""
+
+    def _compiled(stream: Stream, context: EvalContext) -> Stream:
+        del context
+        return function(stream)
+
+    return _compiled
+
+
+def _compile_arg_function(
+    function: Callable[[Stream, Expr, EvalContext], Stream],
+    argument: Expr,
+) -> CompiledQuery:
+    """Compile call to a built-in function taking an argument expression."""
+
+    def _compiled(stream: Stream, context: EvalContext) -> Stream:
+        return function(stream, argument, context)
+
+    return _compiled
+
+
+def _compile_evaluated(expr: Expr) -> CompiledQuery:
+    """Compile expression by delegating to the tree-walking evaluator."""
 
     def _compiled(stream: Stream, context: EvalContext) -> Stream:
         return evaluate_expr(expr, stream, context)
@@ -25,7 +181,32 @@ def compile_expr(expr: Expr) -> CompiledQuery:
     return _compiled
 
 
+def _compiler_entry[E: Expr](
+    node_type: type[E],
+    compiler: Callable[[E], CompiledQuery],
+) -> tuple[type[Expr], ExprCompiler]:
+    """Pair a node type with a compiler checked to accept that node type."""
+    return node_type, cast("ExprCompiler", compiler)
+
+
+_EXPR_COMPILERS: dict[type[Expr], ExprCompiler] = dict(
+    [
+        _compiler_entry(Group, _compile_group),
+        _compiler_entry(Pipe, _compile_pipe),
+        _compiler_entry(Sequence, _compile_sequence),
+        _compiler_entry(FieldAccess, _compile_field_access),
+        _compiler_entry(Iterate, _compile_iterate),
+        _compiler_entry(NumberLiteral, _compile_literal),
+        _compiler_entry(StringLiteral, _compile_literal),
+        _compiler_entry(BoolLiteral, _compile_literal),
+        _compiler_entry(BinaryOp, _compile_binary_op),
+        _compiler_entry(FunctionCall, _compile_function_call),
+    ],
+)
+
+
+@lru_cache(maxsize=256)
 def compile_query_text(query: str) -> CompiledQuery:
-    """Parse and compile query text."""
+    """Parse and compile query text, memoized per query string."""
     expr = parse_query(query)
     return compile_expr(expr)
@@ -17,8 +17,9 @@ from collections.abc import (
 )
 from dataclasses import dataclass
 from datetime import UTC, date, datetime, time, timedelta
+from functools import lru_cache, partial
 from hashlib import sha256
-from itertools import product
+from itertools import product, repeat
 from math import trunc
 from typing import Any, Union, cast, get_args, get_origin, get_type_hints
 from uuid import uuid4
@@ -58,8 +59,9 @@ from org.query.engine.ast import (
 from org.query.engine.errors import QueryRuntimeError
 
 
-class Stream(list[object]):
-    """Typed stream container for query evaluation values."""
+type Stream = list[object]
+type ExprEvaluator = Callable[[Expr, Stream, EvalContext], Stream]
+type StreamEvaluator = Callable[[Stream, EvalContext], Stream]
 
 
 _OPERATOR_NOT_HANDLED = object()
@@ -270,9 +272,7 @@ def _normalized_comparable_temporal(value: object) -> tuple[str, object] | None:
     return ("calendar-delta", value.months) if isinstance(value, CalendarDelta) else None
 
 
-def _stream(values: Iterable[object] = ()) -> Stream:
-    """Build a stream from iterable values."""
-    return Stream(values)
+_stream: type[Stream] = list
 
 
 @dataclass(frozen=True, slots=True)
@@ -284,68 +284,82 @@ class EvalContext:
 
 def evaluate_expr(expr: Expr, stream: Stream, context: EvalContext) -> Stream:
     """Evaluate an expression over the provided stream."""
-    atomic_result = _evaluate_atomic(expr, stream, context)
-    if atomic_result is not None:
-        return atomic_result
-
-    if isinstance(expr, Sequence):
-        return _evaluate_sequence(expr, stream, context)
-    if isinstance(expr, Pipe):
-        left = evaluate_expr(expr.left, stream, context)
-        return evaluate_expr(expr.right, left, context)
-    if isinstance(expr, TupleExpr):
-        return _evaluate_tuple_expr(expr, stream, context)
-    return _evaluate_operator_expr(expr, stream, context)
-
-
-def _evaluate_atomic(expr: Expr, stream: Stream, context: EvalContext) -> Stream | None:
-    """Evaluate expressions that do not require operator dispatch."""
-    result: Stream | None = None
-    if isinstance(expr, Identity):
-        result = _stream(stream)
-    elif isinstance(expr, Group):
-        result = evaluate_expr(expr.expr, stream, context)
-    elif isinstance(expr, FunctionCall):
-        result = _evaluate_function(expr, stream, context)
-    elif isinstance(expr, Variable):
-        result = _stream([context.variables.get(expr.name)])
-    elif isinstance(expr, NumberLiteral | StringLiteral | BoolLiteral):
-        result = _stream([expr.value])
-    elif isinstance(expr, NoneLiteral):
-        result = _stream([None])
-    elif isinstance(expr, AsBinding):
-        result = _evaluate_as_binding(expr, stream, context)
-    elif isinstance(expr, LetBinding):
-        result = _evaluate_let_binding(expr, stream, context)
-    elif isinstance(expr, IfElse):
-        result = _evaluate_if_else(expr, stream, context)
-    return result
-
-
-def _evaluate_operator_expr(expr: Expr, stream: Stream, context: EvalContext) -> Stream:
-    """Evaluate operator-based expressions."""
-    result: Stream | None = None
-    if isinstance(expr, FieldAccess):
-        base = evaluate_expr(expr.base, stream, context)
-        result = _stream([_resolve_field(value, expr.field) for value in base])
-    elif isinstance(expr, BracketFieldAccess):
-        result = _evaluate_bracket_field_access(expr, stream, context)
-    elif isinstance(expr, Iterate):
-        base = evaluate_expr(expr.base, stream, context)
-        result = _evaluate_iterate(base)
-    elif isinstance(expr, Index):
-        result = _evaluate_index(expr, stream, context)
-    elif isinstance(expr, Slice):
-        result = _evaluate_slice(expr, stream, context)
-    elif isinstance(expr, BinaryOp):
-        result = _evaluate_binary_op(expr, stream, context)
-    elif isinstance(expr, Fold):
-        result = _evaluate_fold(expr, stream, context)
-    elif isinstance(expr, DictAssignment):
-        result = _evaluate_dict_assignment(expr, stream, context)
-    if result is not None:
-        return result
-    raise QueryRuntimeError("Unsupported expression type")
+    evaluator = _EXPR_EVALUATORS.get(type(expr))
+    if evaluator is None:
+        raise QueryRuntimeError("Unsupported expression type")
+    return evaluator(expr, stream, context)
+
+
+def _constant_values(expr: Expr, context: EvalContext) -> Stream | None:
+    """Evaluate literal expression once, or return None when it depends on the input item."""
+    inner = expr
+    while isinstance(inner, Group):
+        inner = inner.expr
+    if not isinstance(inner, (NumberLiteral, StringLiteral, BoolLiteral, NoneLiteral)):
+        return None
+    return evaluate_expr(inner, _stream(), context)
+
+
+def _evaluate_or_reuse(
+    expr: Expr,
+    constant_values: Stream | None,
+    stream: Stream,
+    context: EvalContext,
+) -> Stream:
+    """Return hoisted constant values or evaluate expression against stream."""
+    if constant_values is not None:
+        return constant_values
+    return evaluate_expr(expr, stream, context)
+
+
+def _evaluate_identity(expr: Identity, stream: Stream, context: EvalContext) -> Stream:
+    """Evaluate identity by passing through a copy of the stream."""
+    del expr, context
+    return _stream(stream)
+
+
+def _evaluate_group(expr: Group, stream: Stream, context: EvalContext) -> Stream:
+    """Evaluate parenthesized expression."""
+    return evaluate_expr(expr.expr, stream, context)
+
+
+def _evaluate_pipe(expr: Pipe, stream: Stream, context: EvalContext) -> Stream:
+    """Evaluate right expression over the results of the left expression."""
+    left = evaluate_expr(expr.left, stream, context)
+    return evaluate_expr(expr.right, left, context)
+
+
+def _evaluate_variable(expr: Variable, stream: Stream, context: EvalContext) -> Stream:
+    """Evaluate variable reference."""
+    del stream
+    return _stream([context.variables.get(expr.name)])
+
+
+def _evaluate_literal(
+    expr: NumberLiteral | StringLiteral | BoolLiteral,
+    stream: Stream,
+    context: EvalContext,
+) -> Stream:
+    """Evaluate number, string or boolean literal."""
+    del stream, context
+    return _stream([expr.value])
+
+
+def _evaluate_none_literal(expr: NoneLiteral, stream: Stream, context: EvalContext) -> Stream:
+    """Evaluate null literal."""
+    del expr, stream, context
+    return _stream([None])
+
+
+def _evaluate_field_access(expr: FieldAccess, stream: Stream, context: EvalContext) -> Stream:
+    """Evaluate attribute-like field access over base values."""
+    base = evaluate_expr(expr.base, stream, context)
+    return _stream([resolve_field(value, expr.field) for value in base])
+
+
+def _evaluate_iterate_expr(expr: Iterate, stream: Stream, context: EvalContext) -> Stream:
+    """Evaluate iteration over base values."""
+    return iterate_values(evaluate_expr(expr.base, stream, context))
 
 
 def _evaluate_sequence(expr: Sequence, stream: Stream, context: EvalContext) -> Stream:
@@ -361,13 +375,16 @@ def _evaluate_dict_assignment(
 ) -> Stream:
     """Evaluate assignment expressions against object fields and collection indexes."""
     output = _stream()
+    key_constant = _constant_values(expr.key_expr, context)
+    value_constant = _constant_values(expr.value, context)
     for item in stream:
-        base_values = evaluate_expr(expr.base, _stream([item]), context)
-        key_values = evaluate_expr(expr.key_expr, _stream([item]), context)
-        value_values = evaluate_expr(expr.value, _stream([item]), context)
+        item_stream = _stream([item])
+        base_values = evaluate_expr(expr.base, item_stream, context)
+        key_values = _evaluate_or_reuse(expr.key_expr, key_constant, item_stream, context)
+        value_values = _evaluate_or_reuse(expr.value, value_constant, item_stream, context)
 
-        key_base_pairs = _broadcast(key_values, base_values)
-        value_key_base_pairs = _broadcast(value_values, _stream(key_base_pairs))
+        key_base_pairs = broadcast(key_values, base_values)
+        value_key_base_pairs = broadcast(value_values, _stream(key_base_pairs))
         for value, key_base_pair in value_key_base_pairs:
             key, base = cast("tuple[object, object]", key_base_pair)
             output.append(_apply_assignment(expr.operator, base, key, value))
@@ -580,11 +597,12 @@ def _evaluate_let_binding(expr: LetBinding, stream: Stream, context: EvalContext
     previous_value = context.variables.get(expr.name)
 
     for item in stream:
-        bound_values = evaluate_expr(expr.value, _stream([item]), context)
+        item_stream = _stream([item])
+        bound_values = evaluate_expr(expr.value, item_stream, context)
         bound_value: object = bound_values[0] if len(bound_values) == 1 else bound_values
 
         context.variables[expr.name] = bound_value
-        output.extend(evaluate_expr(expr.body, _stream([item]), context))
+        output.extend(evaluate_expr(expr.body, item_stream, context))
 
     if had_previous:
         context.variables[expr.name] = previous_value
@@ -596,12 +614,19 @@ def _evaluate_let_binding(expr: LetBinding, stream: Stream, context: EvalContext
 def _evaluate_if_else(expr: IfElse, stream: Stream, context: EvalContext) -> Stream:
     """Evaluate conditional expressions per input stream item."""
     output = _stream()
+    condition_constant = _constant_values(expr.condition, context)
     for item in stream:
-        condition_values = evaluate_expr(expr.condition, _stream([item]), context)
+        item_stream = _stream([item])
+        condition_values = _evaluate_or_reuse(
+            expr.condition,
+            condition_constant,
+            item_stream,
+            context,
+        )
         branch = (
             expr.then_expr if any(bool(value) for value in condition_values) else expr.else_expr
         )
-        output.extend(evaluate_expr(branch, _stream([item]), context))
+        output.extend(evaluate_expr(branch, item_stream, context))
     return output
 
 
@@ -627,7 +652,7 @@ def _fold_stream_values(values: Stream) -> list[object]:
     return folded
 
 
-def _resolve_field(value: object, field: str) -> object:
+def resolve_field(value: object, field: str) -> object:
     """Resolve attribute-like field access with None fallback."""
     if value is None:
         return None
@@ -648,9 +673,11 @@ def _evaluate_bracket_field_access(
 ) -> Stream:
     """Evaluate bracket key access for each item in stream."""
     results = _stream()
+    key_constant = _constant_values(expr.key_expr, context)
     for item in stream:
-        base_values = evaluate_expr(expr.base, _stream([item]), context)
-        key_values = evaluate_expr(expr.key_expr, _stream([item]), context)
+        item_stream = _stream([item])
+        base_values = evaluate_expr(expr.base, item_stream, context)
+        key_values = _evaluate_or_reuse(expr.key_expr, key_constant, item_stream, context)
         for base in base_values:
             for key in key_values:
                 results.append(_resolve_bracket_key(base, key))
@@ -666,7 +693,7 @@ def _resolve_bracket_key(base: object, key: object) -> object:
     if key_text is not None:
         if isinstance(base, Mapping):
             return base.get(key_text)
-        return _resolve_field(base, key_text)
+        return resolve_field(base, key_text)
 
     if not isinstance(key, int):
         raise QueryRuntimeError("Bracket key must be a string or integer")
@@ -685,7 +712,7 @@ def _resolve_bracket_key(base: object, key: object) -> object:
     return None
 
 
-def _evaluate_iterate(base: Stream) -> Stream:
+def iterate_values(base: Stream) -> Stream:
     """Evaluate collection iteration and flatten one level."""
     output = _stream()
     for value in base:
@@ -704,10 +731,12 @@ def _evaluate_iterate(base: Stream) -> Stream:
 def _evaluate_index(expr: Index, stream: Stream, context: EvalContext) -> Stream:
     """Evaluate index access with out-of-bounds returning None."""
     output = _stream()
+    index_constant = _constant_values(expr.index_expr, context)
     for item in stream:
-        base_values = evaluate_expr(expr.base, _stream([item]), context)
-        index_values = evaluate_expr(expr.index_expr, _stream([item]), context)
-        index_pairs = _broadcast(index_values, base_values)
+        item_stream = _stream([item])
+        base_values = evaluate_expr(expr.base, item_stream, context)
+        index_values = _evaluate_or_reuse(expr.index_expr, index_constant, item_stream, context)
+        index_pairs = broadcast(index_values, base_values)
         for index_value, base_value in index_pairs:
             output.append(_index_one(base_value, index_value))
     return output
@@ -737,26 +766,39 @@ def _index_one(base_value: object, index_value: object) -> object:
 def _evaluate_slice(expr: Slice, stream: Stream, context: EvalContext) -> Stream:
     """Evaluate slice access with out-of-bounds returning empty lists."""
     output = _stream()
+    start_constant = _slice_bound_constant(expr.start_expr, context)
+    end_constant = _slice_bound_constant(expr.end_expr, context)
     for item in stream:
-        base_values = evaluate_expr(expr.base, _stream([item]), context)
-        start_values: Stream
-        end_values: Stream
-        if expr.start_expr is None:
-            start_values = _stream([cast("object", None)])
-        else:
-            start_values = evaluate_expr(expr.start_expr, _stream([item]), context)
-        if expr.end_expr is None:
-            end_values = _stream([cast("object", None)])
-        else:
-            end_values = evaluate_expr(expr.end_expr, _stream([item]), context)
-        base_start_pairs = _broadcast(start_values, base_values)
+        item_stream = _stream([item])
+        base_values = evaluate_expr(expr.base, item_stream, context)
+        start_values = _evaluate_slice_bound(expr.start_expr, start_constant, item_stream, context)
+        end_values = _evaluate_slice_bound(expr.end_expr, end_constant, item_stream, context)
+        base_start_pairs = broadcast(start_values, base_values)
         for start_value, base_value in base_start_pairs:
-            end_pairs = _broadcast(end_values, _stream([base_value]))
-            for end_value, base_value_for_end in end_pairs:
-                output.append(_slice_one(base_value_for_end, start_value, end_value))
+            for end_value in end_values:
+                output.append(_slice_one(base_value, start_value, end_value))
     return output
 
 
+def _slice_bound_constant(bound: Expr | None, context: EvalContext) -> Stream | None:
+    """Return hoisted values for an omitted or literal slice bound."""
+    if bound is None:
+        return _stream([None])
+    return _constant_values(bound, context)
+
+
+def _evaluate_slice_bound(
+    bound: Expr | None,
+    constant_values: Stream | None,
+    stream: Stream,
+    context: EvalContext,
+) -> Stream:
+    """Return hoisted slice bound values or evaluate the bound for one item."""
+    if constant_values is not None:
+        return constant_values
+    return evaluate_expr(cast("Expr", bound), stream, context)
+
+
 def _slice_one(base_value: object, start_value: object, end_value: object) -> object:
     """Apply one slice operation."""
     if start_value is not None and not isinstance(start_value, int):
@@ -784,16 +826,34 @@ def _evaluate_binary_op(expr: BinaryOp, stream: Stream, context: EvalContext) ->
         return _evaluate_boolean_binary_op(expr, stream, context)
     left_values = evaluate_expr(expr.left, stream, context)
     right_values = evaluate_expr(expr.right, stream, context)
-    pairs = _broadcast(left_values, right_values)
-    return _stream([_apply_binary_operator(expr.operator, left, right) for left, right in pairs])
+    handler = binary_operator_handler(expr.operator)
+    return _stream([handler(left, right) for left, right in broadcast(left_values, right_values)])
 
 
 def _evaluate_boolean_binary_op(expr: BinaryOp, stream: Stream, context: EvalContext) -> Stream:
     """Evaluate boolean operators with per-item short-circuit semantics."""
+    return evaluate_boolean_operator(
+        expr.operator,
+        partial(evaluate_expr, expr.left),
+        partial(evaluate_expr, expr.right),
+        stream,
+        context,
+    )
+
+
+def evaluate_boolean_operator(
+    operator: str,
+    left: StreamEvaluator,
+    right: StreamEvaluator,
+    stream: Stream,
+    context: EvalContext,
+) -> Stream:
+    """Apply and/or per item, evaluating the right operand only when the left does not decide."""
     output = _stream()
     for item in stream:
-        left_values = evaluate_expr(expr.left, _stream([item]), context)
-        if expr.operator == "or":
+        item_stream = _stream([item])
+        left_values = left(item_stream, context)
+        if operator == "or":
             if len(left_values) == 1 and bool(left_values[0]):
                 output.append(left_values[0])
                 continue
@@ -801,35 +861,41 @@ def _evaluate_boolean_binary_op(expr: BinaryOp, stream: Stream, context: EvalCon
             output.append(False)
             continue
 
-        right_values = evaluate_expr(expr.right, _stream([item]), context)
-        pairs = _broadcast(left_values, right_values)
-        output.extend(_apply_boolean(expr.operator, left, right) for left, right in pairs)
+        right_values = right(item_stream, context)
+        pairs = broadcast(left_values, right_values)
+        output.extend(_apply_boolean(operator, lhs, rhs) for lhs, rhs in pairs)
     return output
 
 
-def _apply_binary_operator(operator: str, left: object, right: object) -> object:
-    """Apply one binary operator to two values."""
-    if operator in {"==", "!="}:
-        return _apply_equality(operator, left, right)
-    if operator in {">", "<", ">=", "<="}:
-        return _apply_compare(operator, left, right)
-    if operator == "matches":
-        left_text = _as_string_value(left)
-        right_text = _as_string_value(right)
-        if left_text is None or right_text is None:
-            raise QueryRuntimeError("matches operator requires two strings")
-        # FIXME Potentially recompiles the same regex multiple times
-        # when broadcasting a scalar to stream.
-        return bool(re.compile(right_text).search(left_text))
-    if operator in {"and", "or"}:
-        return _apply_boolean(operator, left, right)
-    if operator == "in":
-        return _apply_in_operator(left, right)
-    if operator in {"**", "*", "/", "+", "-", "mod", "rem", "quot"}:
-        return _apply_numeric_operator(operator, left, right)
+def binary_operator_handler(operator: str) -> Callable[[object, object], object]:
+    """Return the handler applying one binary operator to two values."""
+    handler = _BINARY_OPERATOR_HANDLERS.get(operator)
+    if handler is None:
+        return partial(_apply_unsupported_operator, operator)
+    return handler
+
+
+def _apply_unsupported_operator(operator: str, left: object, right: object) -> object:
+    """Reject operators without a registered handler."""
+    del left, right
     raise QueryRuntimeError(f"Unsupported operator: {operator}")
 
 
+def _apply_matches_operator(left: object, right: object) -> bool:
+    """Apply regex search operator."""
+    left_text = _as_string_value(left)
+    right_text = _as_string_value(right)
+    if left_text is None or right_text is None:
+        raise QueryRuntimeError("matches operator requires two strings")
+    return bool(_compile_regex(right_text).search(left_text))
+
+
+@lru_cache(maxsize=256)
+def _compile_regex(pattern: str) -> re.Pattern[str]:
+    """Compile regex pattern once per distinct pattern text."""
+    return re.compile(pattern)
+
+
 def _apply_numeric_operator(operator: str, left: object, right: object) -> object:
     """Apply numeric operators with arithmetic semantics."""
     extended_result = _apply_extended_non_numeric_operator(operator, left, right)
@@ -1109,7 +1175,8 @@ def _evaluate_tuple_expr(expr: TupleExpr, stream: Stream, context: EvalContext)
     """Evaluate comma-separated expressions into tuple values."""
     output = _stream()
     for item in stream:
-        parts = [evaluate_expr(item_expr, _stream([item]), context) for item_expr in expr.items]
+        item_stream = _stream([item])
+        parts = [evaluate_expr(item_expr, item_stream, context) for item_expr in expr.items]
         if any(len(part) == 0 for part in parts):
             continue
         for combo in product(*parts):
@@ -1119,62 +1186,17 @@ def _evaluate_tuple_expr(expr: TupleExpr, stream: Stream, context: EvalContext)
 
 def _evaluate_function(expr: FunctionCall, stream: Stream, context: EvalContext) -> Stream:
     """Evaluate built-in function call expression."""
-    no_arg_functions: dict[str, Callable[[Stream], Stream]] = {
-        "analyze": _func_analyze,
-        "all": _func_all,
-        "any": _func_any,
-        "fold": _func_fold,
-        "now": _func_now,
-        "reverse": _func_reverse,
-        "unique": _func_unique,
-        "length": _func_length,
-        "sum": _func_sum,
-        "max": _func_max,
-        "min": _func_min,
-        "type": _func_type,
-        "sha256": _func_sha256,
-        "uuid": _func_uuid,
-        "debug": _func_debug,
-    }
-    arg_functions: dict[str, Callable[[Stream, Expr, EvalContext], Stream]] = {
-        "str": _func_str,
-        "int": _func_int,
-        "float": _func_float,
-        "bool": _func_bool,
-        "date": _func_date,
-        "datetime": _func_datetime,
-        "days": _func_days,
-        "ts": _func_ts,
-        "hours": _func_hours,
-        "match": _func_match,
-        "minutes": _func_minutes,
-        "months": _func_months,
-        "seconds": _func_seconds,
-        "select": _func_select,
-        "sort_by": _func_sort_by,
-        "join": _func_join,
-        "map": _func_map,
-        "not": _func_not,
-        "time": _func_time,
-        "timedelta": _func_timedelta,
-        "timestamp": _func_timestamp,
-        "clock": _func_clock,
-        "repeat": _func_repeat,
-        "weeks": _func_weeks,
-        "years": _func_years,
-    }
-
-    if expr.name in no_arg_functions:
+    if expr.name in NO_ARG_FUNCTIONS:
         if expr.argument is not None:
             raise QueryRuntimeError(f"{expr.name} does not accept an argument")
-        return no_arg_functions[expr.name](stream)
+        return NO_ARG_FUNCTIONS[expr.name](stream)
 
-    if expr.name in arg_functions:
+    if expr.name in ARG_FUNCTIONS:
         if expr.argument is None:
             raise QueryRuntimeError(f"{expr.name} requires an argument")
-        return arg_functions[expr.name](stream, expr.argument, context)
+        return ARG_FUNCTIONS[expr.name](stream, expr.argument, context)
 
-    available = ", ".join(sorted({*no_arg_functions, *arg_functions}))
+    available = ", ".join(sorted({*NO_ARG_FUNCTIONS, *ARG_FUNCTIONS}))
     raise QueryRuntimeError(f"Unsupported function: {expr.name}. Available functions: {available}")
 
 
@@ -1203,7 +1225,8 @@ def _iter_function_argument_values(
     """Yield evaluated argument combinations per input item."""
     arg_exprs = _argument_expressions(argument)
     for item in stream:
-        arg_parts = [evaluate_expr(part, _stream([item]), context) for part in arg_exprs]
+        item_stream = _stream([item])
+        arg_parts = [evaluate_expr(part, item_stream, context) for part in arg_exprs]
         if any(len(part) == 0 for part in arg_parts):
             continue
         yield from product(*arg_parts)
@@ -1555,7 +1578,7 @@ def _func_match(stream: Stream, argument: Expr, context: EvalContext) -> Stream:
             regex_text = _as_string_value(regex_value)
             if regex_text is None:
                 raise QueryRuntimeError("match requires string regex values")
-            match_result = re.search(regex_text, item_text)
+            match_result = _compile_regex(regex_text).search(item_text)
             if match_result is None:
                 output.append(None)
                 continue
@@ -1959,12 +1982,116 @@ def _extract_numeric_collection(value: object) -> list[int | float]:
     return cast("list[int | float]", collection)
 
 
-def _broadcast(left: Stream, right: Stream) -> list[tuple[object, object]]:
+def broadcast(left: Stream, right: Stream) -> Iterable[tuple[object, object]]:
     """Broadcast two streams to compatible pairs."""
-    if len(left) == len(right):
-        return list(zip(left, right, strict=True))
-    if len(left) == 1:
-        return [(left[0], value) for value in right]
-    if len(right) == 1:
-        return [(value, right[0]) for value in left]
+    left_length = len(left)
+    right_length = len(right)
+    if left_length == 1 and right_length == 1:
+        return ((left[0], right[0]),)
+    if left_length == right_length:
+        return zip(left, right, strict=True)
+    if left_length == 1:
+        return zip(repeat(left[0]), right)
+    if right_length == 1:
+        return zip(left, repeat(right[0]))
     raise QueryRuntimeError("Cannot combine streams with incompatible lengths")
+
+
+NO_ARG_FUNCTIONS: dict[str, Callable[[Stream], Stream]] = {
+    "analyze": _func_analyze,
+    "all": _func_all,
+    "any": _func_any,
+    "fold": _func_fold,
+    "now": _func_now,
+    "reverse": _func_reverse,
+    "unique": _func_unique,
+    "length": _func_length,
+    "sum": _func_sum,
+    "max": _func_max,
+    "min": _func_min,
+    "type": _func_type,
+    "sha256": _func_sha256,
+    "uuid": _func_uuid,
+    "debug": _func_debug,
+}
+
+ARG_FUNCTIONS: dict[str, Callable[[Stream, Expr, EvalContext], Stream]] = {
+    "str": _func_str,
+    "int": _func_int,
+    "float": _func_float,
+    "bool": _func_bool,
+    "date": _func_date,
+    "datetime": _func_datetime,
+    "days": _func_days,
+    "ts": _func_ts,
+    "hours": _func_hours,
+    "match": _func_match,
+    "minutes": _func_minutes,
+    "months": _func_months,
+    "seconds": _func_seconds,
+    "select": _func_select,
+    "sort_by": _func_sort_by,
+    "join": _func_join,
+    "map": _func_map,
+    "not": _func_not,
+    "time": _func_time,
+    "timedelta": _func_timedelta,
+    "timestamp": _func_timestamp,
+    "clock": _func_clock,
+    "repeat": _func_repeat,
+    "weeks": _func_weeks,
+    "years": _func_years,
+}
+
+_BINARY_OPERATOR_HANDLERS: dict[str, Callable[[object, object], object]] = {
+    "==": partial(_apply_equality, "=="),
+    "!=": partial(_apply_equality, "!="),
+    ">": partial(_apply_compare, ">"),
+    "<": partial(_apply_compare, "<"),
+    ">=": partial(_apply_compare, ">="),
+    "<=": partial(_apply_compare, "<="),
+    "matches": _apply_matches_operator,
+    "and": partial(_apply_boolean, "and"),
+    "or": partial(_apply_boolean, "or"),
+    "in": _apply_in_operator,
+    **{
+        operator: partial(_apply_numeric_operator, operator)
+        for operator in ("**", "*", "/", "+", "-", "mod", "rem", "quot")
+    },
+}
+
+
+def _evaluator_entry[E: Expr](
+    node_type: type[E],
+    evaluator: Callable[[E, Stream, EvalContext], Stream],
+) -> tuple[type[Expr], ExprEvaluator]:
+    """Pair a node type with an evaluator checked to accept that node type."""
+    return node_type, cast("ExprEvaluator", evaluator)
+
+
+_EXPR_EVALUATORS: dict[type[Expr], ExprEvaluator] = dict(
+    [
+        _evaluator_entry(Identity, _evaluate_identity),
+        _evaluator_entry(Group, _evaluate_group),
+        _evaluator_entry(Pipe, _evaluate_pipe),
+        _evaluator_entry(Sequence, _evaluate_sequence),
+        _evaluator_entry(TupleExpr, _evaluate_tuple_expr),
+        _evaluator_entry(FunctionCall, _evaluate_function),
+        _evaluator_entry(Variable, _evaluate_variable),
+        _evaluator_entry(NumberLiteral, _evaluate_literal),
+        _evaluator_entry(StringLiteral, _evaluate_literal),
+        _evaluator_entry(BoolLiteral, _evaluate_literal),
+        _evaluator_entry(NoneLiteral, _evaluate_none_literal),
+        _evaluator_entry(AsBinding, _evaluate_as_binding),
+        _evaluator_entry(LetBinding, _evaluate_let_binding),
+        _evaluator_entry(IfElse, _evaluate_if_else),
+        _evaluator_entry(FieldAccess, _evaluate_field_access),
+        _evaluator_entry(BracketFieldAccess, _evaluate_bracket_field_access),
+        _evaluator_entry(Iterate, _evaluate_iterate_expr),
+        _evaluator_entry(Index, _evaluate_index),
+        _evaluator_entry(Slice, _evaluate_slice),
+        _evaluator_entry(BinaryOp, _evaluate_binary_op),
+        _evaluator_entry(Fold, _evaluate_fold),
+        _evaluator_entry(DictAssignment, _evaluate_dict_assignment),
+    ],
+)
@@ -3,10 +3,11 @@
 from __future__ import annotations
 
 import ast
+import re
+import string
+import sys
 from functools import lru_cache
-from typing import TYPE_CHECKING, Literal, cast
-
-from parsy import ParseError, Parser, eof, forward_declaration, generate, regex, seq, string
+from typing import TYPE_CHECKING, ClassVar
 
 from org.query.engine.ast import (
     AsBinding,
@@ -37,375 +38,180 @@ from org.query.engine.errors import QueryParseError
 
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Generator
-
-
-KNOWN_FUNCTIONS = {
-    "analyze",
-    "all",
-    "any",
-    "bool",
-    "date",
-    "datetime",
-    "days",
-    "float",
-    "fold",
-    "hours",
-    "int",
-    "reverse",
-    "unique",
-    "select",
-    "sort_by",
-    "length",
-    "sum",
-    "max",
-    "min",
-    "join",
-    "map",
-    "match",
-    "minutes",
-    "months",
-    "now",
-    "seconds",
-    "sha256",
-    "str",
-    "time",
-    "timedelta",
-    "ts",
-    "type",
-    "timestamp",
-    "clock",
-    "repeat",
-    "weeks",
-    "years",
-    "uuid",
-    "not",
-    "debug",
-}
-
-type FieldPostfix = tuple[Literal["field"], str]
-type IteratePostfix = tuple[Literal["iterate"]]
-type SlicePostfix = tuple[Literal["slice"], Expr | None, Expr | None]
-type IndexPostfix = tuple[Literal["index"], Expr]
-type BracketFieldPostfix = tuple[Literal["bracket-field"], StringLiteral]
-type PostfixOp = FieldPostfix | IteratePostfix | SlicePostfix | IndexPostfix | BracketFieldPostfix
-
-
-def _parse_line_and_column(line_info: str) -> tuple[int, int]:
-    """Parse line and column from parsy line info string."""
-    line_text, sep, column_text = line_info.partition(":")
-    if sep == "":
-        return (0, 0)
-    if not line_text.isdigit() or not column_text.isdigit():
-        return (0, 0)
-    return (int(line_text), int(column_text))
-
-
-def _format_parse_error(query: str, exc: ParseError) -> str:
-    """Build rich parse error message with query pointer."""
-    line_number, column_number = _parse_line_and_column(exc.line_info())
-    query_lines = query.splitlines()
-    if not query_lines:
-        query_lines = [query]
-
-    error_line = query_lines[line_number] if 0 <= line_number < len(query_lines) else query
-    pointer = " " * max(column_number, 0) + "^"
-    return f"Invalid query syntax: {exc}\n\n{error_line}\n{pointer}"
-
-
-def _decode_string(token_value: str) -> str:
-    """Decode a double-quoted string literal token."""
-    decoded = ast.literal_eval(token_value)
-    if isinstance(decoded, str):
-        return decoded
-    raise QueryParseError("Invalid string literal")
-
-
-def _keyword(name: str) -> Parser:
-    """Build a keyword parser with identifier boundary."""
-    return regex(rf"{name}(?![A-Za-z0-9_])").desc(name)
-
-
-def _lexeme(parser: Parser) -> Parser:
-    """Consume optional whitespace after parser."""
-    ws = regex(r"\s*")
-    return parser << ws
-
-
-def _symbol(value: str) -> Parser:
-    """Build a symbol token parser."""
-    return _lexeme(string(value))
-
-
-def _build_value_parser(
-    identifier: Parser,
-    number_token: Parser,
-    string_token: Parser,
-) -> tuple[
-    Parser,
-    Parser,
-    Parser,
-    Parser,
-    Parser,
-    Parser,
-]:
-    """Build parsers for literal and variable values."""
-    true_literal = _lexeme(_keyword("true")).result(BoolLiteral(True))
-    false_literal = _lexeme(_keyword("false")).result(BoolLiteral(False))
-    null_literal = _lexeme(_keyword("null")).result(NoneLiteral())
-    variable = (_symbol("$") >> identifier).map(Variable)
-    number_literal = number_token.map(
-        lambda v: NumberLiteral(float(v)) if "." in v else NumberLiteral(int(v)),
+    from collections.abc import Callable
+
+
+KNOWN_FUNCTIONS = frozenset(
+    sys.intern(name)
+    for name in (
+        "analyze",
+        "all",
+        "any",
+        "bool",
+        "date",
+        "datetime",
+        "days",
+        "float",
+        "fold",
+        "hours",
+        "int",
+        "reverse",
+        "unique",
+        "select",
+        "sort_by",
+        "length",
+        "sum",
+        "max",
+        "min",
+        "join",
+        "map",
+        "match",
+        "minutes",
+        "months",
+        "now",
+        "seconds",
+        "sha256",
+        "str",
+        "time",
+        "timedelta",
+        "ts",
+        "type",
+        "timestamp",
+        "clock",
+        "repeat",
+        "weeks",
+        "years",
+        "uuid",
+        "not",
+        "debug",
     )
-    string_literal = string_token.map(lambda v: StringLiteral(_decode_string(v)))
-    return (
-        true_literal,
-        false_literal,
-        null_literal,
-        variable,
-        number_literal,
-        string_literal,
-    )
-
-
-def _build_function_call_parser(identifier: Parser, expr: Parser) -> Parser:
-    """Build parser for known function calls."""
-
-    @generate
-    def function_call() -> Generator[Parser, object, FunctionCall]:
-        name_result = yield identifier
-        if not isinstance(name_result, str):
-            raise QueryParseError("Invalid function name")
-        name = name_result
-        if name not in KNOWN_FUNCTIONS:
-            available = ", ".join(sorted(KNOWN_FUNCTIONS))
-            raise QueryParseError(f"Unknown function: {name}. Available functions: {available}")
-        arg_result = yield (_symbol("(") >> expr << _symbol(")")).optional()
-        if arg_result is not None and not isinstance(arg_result, Expr):
-            raise QueryParseError("Invalid function argument")
-        return FunctionCall(name, arg_result)
-
-    return function_call
-
-
-def _build_bracket_postfix_parser(index_expr: Parser) -> Parser:
-    """Build parser for bracket-based postfix operators."""
-
-    @generate
-    def bracket_postfix() -> Generator[Parser, object, PostfixOp]:
-        yield _symbol("[")
-        empty = yield _symbol("]").optional()
-        if empty is not None:
-            return ("iterate",)
-
-        start_result = yield index_expr.optional()
-        if start_result is not None and not isinstance(start_result, Expr):
-            raise QueryParseError("Invalid bracket expression")
-        start = start_result
-        colon = yield _symbol(":").optional()
-        if colon is not None:
-            end_result = yield index_expr.optional()
-            if end_result is not None and not isinstance(end_result, Expr):
-                raise QueryParseError("Invalid slice expression")
-            end = end_result
-            yield _symbol("]")
-            return ("slice", start, end)
-
-        yield _symbol("]")
-        if start is None:
-            raise QueryParseError("Expected index, key, or slice in brackets")
-        if isinstance(start, StringLiteral):
-            return ("bracket-field", start)
-        return ("index", start)
-
-    return bracket_postfix
-
-
-def _build_dot_expression_parser(identifier: Parser, bracket_postfix: Parser) -> Parser:
-    """Build parser for dot-rooted path expressions."""
-    dot_field_postfix = (_symbol(".") >> identifier).map(_field_postfix)
-    postfix = dot_field_postfix | bracket_postfix
-
-    @generate
-    def dot_expression() -> Generator[Parser, object, Expr]:
-        yield string(".")
-        first_field_result = yield identifier.optional()
-        if first_field_result is not None and not isinstance(first_field_result, str):
-            raise QueryParseError("Invalid field name")
-        first_field = first_field_result
-
-        current: Expr
-        if first_field is None:
-            first_bracket_result = yield bracket_postfix.optional()
-            if first_bracket_result is not None and not isinstance(first_bracket_result, tuple):
-                raise QueryParseError("Invalid bracket postfix")
-            first_bracket = cast("PostfixOp | None", first_bracket_result)
-            current = (
-                Identity() if first_bracket is None else _apply_postfix(Identity(), first_bracket)
-            )
-        else:
-            current = FieldAccess(Identity(), first_field)
-
-        rest_result = yield postfix.many()
-        if not isinstance(rest_result, list):
-            raise QueryParseError("Invalid postfix chain")
-        rest = cast("list[PostfixOp]", rest_result)
-        for op in rest:
-            current = _apply_postfix(current, op)
-        yield regex(r"\s*")
-        return current
-
-    return dot_expression
-
-
-def _build_grouped_parser(expr: Parser) -> Parser:
-    """Build parser for grouped expressions."""
+)
+_AVAILABLE_FUNCTIONS = ", ".join(sorted(KNOWN_FUNCTIONS))
+
+_IDENTIFIER_CHARS = frozenset(string.ascii_letters + string.digits + "_")
+_IDENTIFIER_PATTERN = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+_NUMBER_PATTERN = re.compile(r"\d+(?:\.\d+)?")
+_STRING_PATTERN = re.compile(r'"(?:[^"\\]|\\.)*"')
+_STRING_ESCAPE_PATTERN = re.compile(r"\\(.)")
+_SIMPLE_STRING_ESCAPES = {"\\": "\\", '"': '"', "'": "'", "n": "\n", "r": "\r", "t": "\t"}
+_PYTHON_STRING_ESCAPES = frozenset("abfvxNuU01234567")
+
+_SYMBOL_OPERATORS = (
+    "**",
+    ">=",
+    "<=",
+    "==",
+    "!=",
+    "+=",
+    "-=",
+    "*",
+    "/",
+    "+",
+    "-",
+    ">",
+    "<",
+    "=",
+)
 
-    @generate
-    def grouped() -> Generator[Parser, object, Group]:
-        yield _symbol("(")
-        inner = yield expr
-        if not isinstance(inner, Expr):
-            raise QueryParseError("Invalid grouped expression")
-        yield _symbol(")")
-        return Group(inner)
 
+def _group_operators_by_first_char(operators: tuple[str, ...]) -> dict[str, tuple[str, ...]]:
+    """Group operators by leading character, longest operator first."""
+    grouped: dict[str, tuple[str, ...]] = {}
+    for operator in sorted(operators, key=len, reverse=True):
+        grouped[operator[0]] = (*grouped.get(operator[0], ()), operator)
     return grouped
 
 
-def _build_fold_parser(expr: Parser) -> Parser:
-    """Build parser for stream fold expressions `[subquery]`."""
-
-    @generate
-    def fold() -> Generator[Parser, object, Fold]:
-        yield _symbol("[")
-        close = yield _symbol("]").optional()
-        if close is not None:
-            return Fold(None)
-        inner = yield expr
-        if not isinstance(inner, Expr):
-            raise QueryParseError("Invalid fold expression")
-        yield _symbol("]")
-        return Fold(inner)
-
-    return fold
-
-
-def _build_let_binding_parser(value_expr: Parser, body_expr: Parser, identifier: Parser) -> Parser:
-    """Build parser for scoped let binding expressions."""
-
-    @generate
-    def let_binding() -> Generator[Parser, object, LetBinding]:
-        yield _lexeme(_keyword("let"))
-        value_result = yield value_expr
-        if not isinstance(value_result, Expr):
-            raise QueryParseError("Invalid let value expression")
-        yield _lexeme(_keyword("as"))
-        yield _symbol("$")
-        name_result = yield identifier
-        if not isinstance(name_result, str):
-            raise QueryParseError("Invalid let variable name")
-        body_result = yield (_lexeme(_keyword("in")) >> body_expr)
-        if not isinstance(body_result, Expr):
-            raise QueryParseError("Invalid let body expression")
-        return LetBinding(value_result, name_result, body_result)
-
-    return let_binding
-
+_SYMBOL_OPERATORS_BY_FIRST_CHAR = _group_operators_by_first_char(_SYMBOL_OPERATORS)
+_KEYWORD_OPERATORS = frozenset({"and", "or", "matches", "in", "mod", "rem", "quot"})
+_BOOLEAN_PRECEDENCE = 1
+_COMPARISON_PRECEDENCE = 2
+_ADDITIVE_PRECEDENCE = 3
+_MULTIPLY_PRECEDENCE = 4
+_BINARY_PRECEDENCE = {
+    "and": _BOOLEAN_PRECEDENCE,
+    "or": _BOOLEAN_PRECEDENCE,
+    ">=": _COMPARISON_PRECEDENCE,
+    "<=": _COMPARISON_PRECEDENCE,
+    "==": _COMPARISON_PRECEDENCE,
+    "!=": _COMPARISON_PRECEDENCE,
+    ">": _COMPARISON_PRECEDENCE,
+    "<": _COMPARISON_PRECEDENCE,
+    "matches": _COMPARISON_PRECEDENCE,
+    "in": _COMPARISON_PRECEDENCE,
+    "+": _ADDITIVE_PRECEDENCE,
+    "-": _ADDITIVE_PRECEDENCE,
+    "*": _MULTIPLY_PRECEDENCE,
+    "/": _MULTIPLY_PRECEDENCE,
+    "mod": _MULTIPLY_PRECEDENCE,
+    "rem": _MULTIPLY_PRECEDENCE,
+    "quot": _MULTIPLY_PRECEDENCE,
+}
+_ASSIGNMENT_OPERATORS = frozenset({"=", "+=", "-="})
+_SMALL_INTEGER_LITERALS = tuple(NumberLiteral(value) for value in range(257))
+_ZERO = _SMALL_INTEGER_LITERALS[0]
+_KEYWORD_LITERALS: dict[str, Expr] = {
+    "true": BoolLiteral(True),
+    "false": BoolLiteral(False),
+    "null": NoneLiteral(),
+}
+_TRIVIAL_QUERIES: dict[str, Expr] = {".": Identity(), **_KEYWORD_LITERALS}
 
-def _build_if_else_parser(expr: Parser) -> Parser:
-    """Build parser for conditional if-then-elif-else expressions."""
-    elif_clause = seq(
-        _lexeme(_keyword("elif")) >> (expr << _lexeme(_keyword("then"))),
-        expr,
-    )
 
-    @generate
-    def if_else() -> Generator[Parser, object, IfElse]:
-        yield _lexeme(_keyword("if"))
-        condition_result = yield (expr << _lexeme(_keyword("then")))
-        if not isinstance(condition_result, Expr):
-            raise QueryParseError("Invalid if condition expression")
-        then_result = yield expr
-        if not isinstance(then_result, Expr):
-            raise QueryParseError("Invalid then expression")
-
-        elif_clauses_result = yield elif_clause.many()
-        if not isinstance(elif_clauses_result, list):
-            raise QueryParseError("Invalid elif clauses")
-        elif_clauses = cast("list[tuple[object, object]]", elif_clauses_result)
-
-        yield _lexeme(_keyword("else"))
-        else_result = yield expr
-        if not isinstance(else_result, Expr):
-            raise QueryParseError("Invalid else expression")
-
-        branches: list[tuple[Expr, Expr]] = [(condition_result, then_result)]
-        for elif_condition, elif_then in elif_clauses:
-            if not isinstance(elif_condition, Expr):
-                raise QueryParseError("Invalid elif condition expression")
-            if not isinstance(elif_then, Expr):
-                raise QueryParseError("Invalid elif then expression")
-            branches.append((elif_condition, elif_then))
-
-        current_else: Expr = else_result
-        for branch_condition, branch_then in reversed(branches):
-            current_else = IfElse(branch_condition, branch_then, current_else)
-        return cast("IfElse", current_else)
-
-    return if_else
-
-
-def _build_postfix_chain_parser(
-    base_parser: Parser,
-    identifier: Parser,
-    bracket_postfix: Parser,
-) -> Parser:
-    """Build parser applying postfix operators to any primary expression."""
-    dot_field_postfix = (_symbol(".") >> identifier).map(_field_postfix)
-    postfix = dot_field_postfix | bracket_postfix
-
-    @generate
-    def with_postfix() -> Generator[Parser, object, Expr]:
-        current_result = yield base_parser
-        if not isinstance(current_result, Expr):
-            raise QueryParseError("Invalid base expression")
-        current: Expr = current_result
-
-        rest_result = yield postfix.many()
-        if not isinstance(rest_result, list):
-            raise QueryParseError("Invalid postfix chain")
-        rest = cast("list[PostfixOp]", rest_result)
-        for op in rest:
-            current = _apply_postfix(current, op)
-        return current
+class _QuerySyntaxError(Exception):
+    """Raised when query text does not match the query grammar."""
 
-    return with_postfix
+    def __init__(self, text: str, index: int, expected: str) -> None:
+        """Initialize error with query text, failing offset, and expected token."""
+        super().__init__(expected)
+        self.text = text
+        self.index = index
+        self.expected = expected
 
+    def line_info(self) -> str:
+        """Return zero-based line and column of the failing offset."""
+        line = self.text.count("\n", 0, self.index)
+        column = self.index - self.text.rfind("\n", 0, self.index) - 1
+        return f"{line}:{column}"
 
-def _field_postfix(name: str) -> FieldPostfix:
-    """Create field postfix marker tuple."""
-    return ("field", name)
+    def __str__(self) -> str:
+        """Return expected token description with failing position."""
+        return f"expected {self.expected} at {self.line_info()}"
 
 
-def _binary_builder(operator: str, left: Expr, right: Expr) -> Expr:
-    """Construct binary operation expression."""
-    return BinaryOp(operator, left, right)
+def _format_parse_error(query: str, exc: _QuerySyntaxError) -> str:
+    """Build rich parse error message with query pointer."""
+    line_start = query.rfind("\n", 0, exc.index) + 1
+    line_end = query.find("\n", exc.index)
+    if line_end == -1:
+        line_end = len(query)
+    error_line = query[line_start:line_end].removesuffix("\r")
+    pointer = " " * (exc.index - line_start) + "^"
+    return f"Invalid query syntax: {exc}\n\n{error_line}\n{pointer}"
 
 
-def _pipe_builder(_operator: str, left: Expr, right: Expr) -> Expr:
-    """Construct pipe expression."""
-    return Pipe(left, right)
+def _decode_string(token_value: str) -> str:
+    """Decode a double-quoted string literal token."""
+    body = token_value[1:-1]
+    if "\\" not in body:
+        return body
+    escapes = _STRING_ESCAPE_PATTERN.findall(body)
+    if not _PYTHON_STRING_ESCAPES.isdisjoint(escapes):
+        return _decode_python_string(token_value)
+    return _STRING_ESCAPE_PATTERN.sub(_replace_string_escape, body)
 
 
-def _sequence_builder(_operator: str, left: Expr, right: Expr) -> Expr:
-    """Construct sequencing expression."""
-    return Sequence(left, right)
+def _replace_string_escape(match: re.Match[str]) -> str:
+    """Resolve one simple backslash escape, keeping unknown escapes verbatim."""
+    return _SIMPLE_STRING_ESCAPES.get(match.group(1), match.group())
 
 
-def _assignment_builder(operator: str, left: Expr, right: Expr) -> Expr:
-    """Construct assignment expression."""
-    return _build_assignment_expr(operator, left, right)
+def _decode_python_string(token_value: str) -> str:
+    """Decode string literal token with numeric or named escapes."""
+    decoded = ast.literal_eval(token_value)
+    if isinstance(decoded, str):
+        return decoded
+    raise QueryParseError("Invalid string literal")
 
 
 def _build_assignment_expr(operator: str, left: Expr, right: Expr) -> Expr:
@@ -421,243 +227,352 @@ def _build_assignment_expr(operator: str, left: Expr, right: Expr) -> Expr:
     raise QueryParseError("Assignment target must be .field or [<field-or-index-subquery>] access")
 
 
-def _make_parser() -> Parser:
-    """Create the full expression parser."""
-    ws = regex(r"\s*")
-    identifier = _lexeme(regex(r"[A-Za-z_][A-Za-z0-9_]*"))
-    number_token = _lexeme(regex(r"\d+(?:\.\d+)?"))
-    string_token = _lexeme(regex(r'"(?:[^"\\]|\\.)*"'))
-
-    expr = forward_declaration()
-    index_expr = forward_declaration()
-
-    (
-        true_literal,
-        false_literal,
-        null_literal,
-        variable,
-        number_literal,
-        string_literal,
-    ) = _build_value_parser(identifier, number_token, string_token)
-    function_call = _build_function_call_parser(identifier, expr)
-    bracket_postfix = _build_bracket_postfix_parser(index_expr)
-    dot_expression = _build_dot_expression_parser(identifier, bracket_postfix)
-    grouped = _build_grouped_parser(expr)
-    fold = _build_fold_parser(expr)
-    if_else = _build_if_else_parser(expr)
-
-    base_atom = (
-        dot_expression
-        | grouped
-        | fold
-        | if_else
-        | true_literal
-        | false_literal
-        | null_literal
-        | function_call
-        | variable
-        | number_literal
-        | string_literal
-    )
-    atom = _build_postfix_chain_parser(base_atom, identifier, bracket_postfix)
-
-    power = _chain_right(atom, _symbol("**"), _binary_builder)
-
-    @generate
-    def unary() -> Generator[Parser, object, Expr]:
-        minuses_result = yield _symbol("-").many()
-        if not isinstance(minuses_result, list):
-            raise QueryParseError("Invalid unary minus expression")
-        value_result = yield power
-        if not isinstance(value_result, Expr):
-            raise QueryParseError("Invalid unary minus operand")
-
-        current: Expr = value_result
-        for _minus in minuses_result:
-            current = BinaryOp("-", NumberLiteral(0), current)
+class _QueryParser:
+    """Recursive-descent parser over a single query string."""
+
+    __slots__ = ("_pos", "_text")
+
+    def __init__(self, text: str) -> None:
+        """Initialize parser positioned at the start of query text."""
+        self._text = text
+        self._pos = 0
+
+    def parse(self) -> Expr:
+        """Parse the complete query text into one expression."""
+        self._skip_whitespace()
+        expr = self._parse_pipe()
+        if self._pos < len(self._text):
+            raise self._error("EOF")
+        return expr
+
+    def _error(self, expected: str) -> _QuerySyntaxError:
+        """Build syntax error at the current position."""
+        return _QuerySyntaxError(self._text, self._pos, expected)
+
+    def _skip_whitespace(self) -> None:
+        """Advance past whitespace at the current position."""
+        text = self._text
+        pos = self._pos
+        end = len(text)
+        while pos < end and text[pos].isspace():
+            pos += 1
+        self._pos = pos
+
+    def _consume_pattern(self, pattern: re.Pattern[str]) -> str | None:
+        """Consume one pattern token and trailing whitespace, if present."""
+        match = pattern.match(self._text, self._pos)
+        if match is None:
+            return None
+        self._pos = match.end()
+        self._skip_whitespace()
+        return match.group()
+
+    def _match_symbol(self, symbol: str) -> bool:
+        """Consume symbol and trailing whitespace when present."""
+        if not self._text.startswith(symbol, self._pos):
+            return False
+        self._pos += len(symbol)
+        self._skip_whitespace()
+        return True
+
+    def _expect_symbol(self, symbol: str) -> None:
+        """Consume symbol or fail with syntax error."""
+        if not self._match_symbol(symbol):
+            raise self._error(f"'{symbol}'")
+
+    def _peek_identifier(self) -> str | None:
+        """Return identifier at the current position without consuming it."""
+        match = _IDENTIFIER_PATTERN.match(self._text, self._pos)
+        return None if match is None else match.group()
+
+    def _at_keyword(self, keyword: str) -> bool:
+        """Return whether keyword starts at the current position as a whole word."""
+        end = self._pos + len(keyword)
+        return (
+            self._text.startswith(keyword, self._pos)
+            and self._text[end : end + 1] not in _IDENTIFIER_CHARS
+        )
+
+    def _match_keyword(self, keyword: str) -> bool:
+        """Consume keyword and trailing whitespace when present."""
+        if not self._at_keyword(keyword):
+            return False
+        self._pos += len(keyword)
+        self._skip_whitespace()
+        return True
+
+    def _expect_keyword(self, keyword: str) -> None:
+        """Consume keyword or fail with syntax error."""
+        if not self._match_keyword(keyword):
+            raise self._error(f"'{keyword}'")
+
+    def _consume_identifier(self) -> str | None:
+        """Consume interned identifier and trailing whitespace, if present."""
+        name = self._consume_pattern(_IDENTIFIER_PATTERN)
+        return None if name is None else sys.intern(name)
+
+    def _expect_identifier(self) -> str:
+        """Consume identifier or fail with syntax error."""
+        name = self._consume_identifier()
+        if name is None:
+            raise self._error("identifier")
+        return name
+
+    def _peek_operator(self) -> str | None:
+        """Return the longest binary operator at the current position."""
+        candidates = _SYMBOL_OPERATORS_BY_FIRST_CHAR.get(self._text[self._pos : self._pos + 1])
+        if candidates is not None:
+            for operator in candidates:
+                if self._text.startswith(operator, self._pos):
+                    return operator
+            return None
+        keyword = self._peek_identifier()
+        return sys.intern(keyword) if keyword in _KEYWORD_OPERATORS else None
+
+    def _match_operator(self, operators: frozenset[str]) -> str | None:
+        """Consume binary operator when it belongs to the given operator set."""
+        operator = self._peek_operator()
+        if operator is None or operator not in operators:
+            return None
+        self._pos += len(operator)
+        self._skip_whitespace()
+        return operator
+
+    def _parse_pipe(self) -> Expr:
+        """Parse pipe-separated expressions."""
+        left = self._parse_sequence()
+        while self._match_symbol("|"):
+            left = Pipe(left, self._parse_sequence())
+        return left
+
+    def _parse_sequence(self) -> Expr:
+        """Parse semicolon-separated expressions."""
+        left = self._parse_assignment()
+        while self._match_symbol(";"):
+            left = Sequence(left, self._parse_assignment())
+        return left
+
+    def _parse_assignment(self) -> Expr:
+        """Parse right-associative assignment expressions."""
+        target = self._parse_as_binding()
+        operator = self._match_operator(_ASSIGNMENT_OPERATORS)
+        if operator is None:
+            return target
+        return _build_assignment_expr(operator, target, self._parse_assignment())
+
+    def _parse_as_binding(self) -> Expr:
+        """Parse `<subquery> as $variable` bindings."""
+        current = self._parse_let_binding() if self._at_keyword("let") else self._parse_tuple()
+        while self._match_keyword("as"):
+            self._expect_symbol("$")
+            current = AsBinding(current, self._expect_identifier())
         return current
 
-    mult_op = _lexeme(
-        string("*") | string("/") | _keyword("mod") | _keyword("rem") | _keyword("quot"),
-    )
-    additive_op = _lexeme(string("+") | string("-"))
-    multiply = _chain_left(unary, mult_op, _binary_builder)
-    additive = _chain_left(multiply, additive_op, _binary_builder)
-    index_expr.become(additive)
-
-    compare_op = _lexeme(
-        string(">=")
-        | string("<=")
-        | string("==")
-        | string("!=")
-        | string(">")
-        | string("<")
-        | _keyword("matches")
-        | _keyword("in"),
-    )
-    bool_op = _lexeme(_keyword("and") | _keyword("or"))
-
-    comparison = _chain_left(additive, compare_op, _binary_builder)
-    boolean = _chain_left(comparison, bool_op, _binary_builder)
-    comma = _chain_comma(boolean)
-
-    let_binding = _build_let_binding_parser(comma, expr, identifier)
-    as_binding = _build_as_binding_parser(let_binding | comma, identifier)
-    assignment_op = _lexeme(string("+=") | string("-=") | string("="))
-    assignment = _chain_right(as_binding, assignment_op, _assignment_builder)
-    sequence = _chain_left(assignment, _symbol(";"), _sequence_builder)
-    pipe = _chain_left(sequence, _symbol("|"), _pipe_builder)
-
-    expr.become(pipe)
-    return ws >> expr << ws << eof
-
-
-def _build_as_binding_parser(term: Parser, identifier: Parser) -> Parser:
-    """Build parser for `<subquery> as $variable` binding."""
-
-    @generate
-    def parser() -> Generator[Parser, object, Expr]:
-        source_result = yield term
-        if not isinstance(source_result, Expr):
-            raise QueryParseError("Invalid binding source")
-        bindings_result = yield (_lexeme(_keyword("as")) >> _symbol("$") >> identifier).many()
-        if not isinstance(bindings_result, list):
-            raise QueryParseError("Invalid binding list")
-        bindings = cast("list[str]", bindings_result)
-
-        current: Expr = source_result
-        for name in bindings:
-            current = AsBinding(current, name)
-        return current
-
-    return parser
-
-
-def _apply_postfix(base: Expr, op: PostfixOp) -> Expr:  # noqa: C901
-    """Apply one postfix operator to an expression."""
-    match op:
-        case ("field", field):
-            if not isinstance(field, str):
-                raise QueryParseError("Invalid field name")
-            return FieldAccess(base, field)
-        case ("iterate",):
+    def _parse_let_binding(self) -> Expr:
+        """Parse scoped `let <value> as $name in <body>` binding."""
+        self._expect_keyword("let")
+        value = self._parse_tuple()
+        self._expect_keyword("as")
+        self._expect_symbol("$")
+        name = self._expect_identifier()
+        self._expect_keyword("in")
+        return LetBinding(value, name, self._parse_pipe())
+
+    def _parse_tuple(self) -> Expr:
+        """Parse comma-separated tuple expressions."""
+        first = self._parse_binary(_BOOLEAN_PRECEDENCE)
+        if not self._text.startswith(",", self._pos):
+            return first
+        items = [first]
+        while self._match_symbol(","):
+            items.append(self._parse_binary(_BOOLEAN_PRECEDENCE))
+        return TupleExpr(tuple(items))
+
+    def _parse_binary(self, min_precedence: int) -> Expr:
+        """Parse left-associative binary operators by precedence climbing."""
+        left = self._parse_unary()
+        while True:
+            operator = self._peek_operator()
+            precedence = 0 if operator is None else _BINARY_PRECEDENCE.get(operator, 0)
+            if operator is None or precedence < min_precedence:
+                return left
+            self._pos += len(operator)
+            self._skip_whitespace()
+            left = BinaryOp(operator, left, self._parse_binary(precedence + 1))
+
+    def _parse_unary(self) -> Expr:
+        """Parse unary minus lowered to subtraction from zero."""
+        if self._match_symbol("-"):
+            return BinaryOp("-", _ZERO, self._parse_unary())
+        return self._parse_power()
+
+    def _parse_power(self) -> Expr:
+        """Parse right-associative exponentiation."""
+        base = self._parse_atom()
+        if self._match_symbol("**"):
+            return BinaryOp("**", base, self._parse_power())
+        return base
+
+    def _parse_atom(self) -> Expr:
+        """Parse primary expression followed by its postfix chain."""
+        current = self._parse_primary()
+        while True:
+            postfix = self._parse_postfix(current)
+            if postfix is None:
+                return current
+            current = postfix
+
+    def _parse_postfix(self, base: Expr) -> Expr | None:
+        """Parse one `.field` or bracket postfix applied to base, if present."""
+        start = self._pos
+        if self._text.startswith("[", start):
+            return self._parse_bracket_postfix(base)
+        if not self._match_symbol("."):
+            return None
+        name = self._consume_identifier()
+        if name is None:
+            self._pos = start
+            return None
+        return FieldAccess(base, name)
+
+    def _parse_bracket_postfix(self, base: Expr) -> Expr:
+        """Parse bracket iterate, index, key, or slice postfix applied to base."""
+        self._expect_symbol("[")
+        if self._match_symbol("]"):
             return Iterate(base)
-        case ("slice", start_expr, end_expr):
-            if start_expr is not None and not isinstance(start_expr, Expr):
-                raise QueryParseError("Invalid slice start")
-            if end_expr is not None and not isinstance(end_expr, Expr):
-                raise QueryParseError("Invalid slice end")
-            return Slice(base, start_expr, end_expr)
-        case ("index", index_expr):
-            if not isinstance(index_expr, Expr):
-                raise QueryParseError("Invalid index expression")
-            return Index(base, index_expr)
-        case ("bracket-field", key_expr):
-            if not isinstance(key_expr, Expr):
-                raise QueryParseError("Invalid bracket field expression")
-            return BracketFieldAccess(base, key_expr)
-
-    raise QueryParseError("Unknown postfix operator")
-
-
-def _chain_left(
-    term: Parser,
-    op: Parser,
-    builder: Callable[[str, Expr, Expr], Expr],
-) -> Parser:
-    """Build a left-associative parser from term and operator parsers."""
-
-    @generate
-    def parser() -> Generator[Parser, object, Expr]:
-        left_result = yield term
-        if not isinstance(left_result, Expr):
-            raise QueryParseError("Invalid left expression")
-
-        rest_result = yield seq(op, term).many()
-        if not isinstance(rest_result, list):
-            raise QueryParseError("Invalid operator chain")
-
-        current: Expr = left_result
-        rest = cast("list[tuple[object, object]]", rest_result)
-        for operator, right in rest:
-            if not isinstance(operator, str):
-                raise QueryParseError("Invalid operator")
-            if not isinstance(right, Expr):
-                raise QueryParseError("Invalid right expression")
-            current = builder(operator, current, right)
-        return current
-
-    return parser
-
-
-def _chain_right(
-    term: Parser,
-    op: Parser,
-    builder: Callable[[str, Expr, Expr], Expr],
-) -> Parser:
-    """Build a right-associative parser from term and operator parsers."""
-
-    @generate
-    def parser() -> Generator[Parser, object, Expr]:
-        left_result = yield term
-        if not isinstance(left_result, Expr):
-            raise QueryParseError("Invalid left expression")
-
-        rest_result = yield seq(op, term).many()
-        if not isinstance(rest_result, list):
-            raise QueryParseError("Invalid operator chain")
-        rest = cast("list[tuple[object, object]]", rest_result)
-
-        if not rest:
-            return left_result
-
-        operators: list[str] = []
-        terms: list[Expr] = [left_result]
-        for operator, right in rest:
-            if not isinstance(operator, str):
-                raise QueryParseError("Invalid operator")
-            if not isinstance(right, Expr):
-                raise QueryParseError("Invalid right expression")
-            operators.append(operator)
-            terms.append(right)
-
-        current: Expr = terms[-1]
-        for index in range(len(operators) - 1, -1, -1):
-            current = builder(operators[index], terms[index], current)
-        return current
-
-    return parser
-
 
-def _chain_comma(term: Parser) -> Parser:
-    """Build comma-level tuple parser."""
+        start = self._parse_bracket_operand(":")
+        if self._match_symbol(":"):
+            end = self._parse_bracket_operand("]")
+            self._expect_symbol("]")
+            return Slice(base, start, end)
 
-    @generate
-    def parser() -> Generator[Parser, object, Expr]:
-        first_result = yield term
-        if not isinstance(first_result, Expr):
-            raise QueryParseError("Invalid tuple expression")
-        rest_result = yield (_symbol(",") >> term).many()
-        if not isinstance(rest_result, list):
-            raise QueryParseError("Invalid tuple expression")
-        rest = cast("list[Expr]", rest_result)
-        if not rest:
-            return first_result
-        return TupleExpr((first_result, *rest))
+        self._expect_symbol("]")
+        if start is None:
+            raise QueryParseError("Expected index, key, or slice in brackets")
+        if isinstance(start, StringLiteral):
+            return BracketFieldAccess(base, start)
+        return Index(base, start)
+
+    def _parse_bracket_operand(self, terminator: str) -> Expr | None:
+        """Parse additive bracket operand unless the terminator follows directly."""
+        if self._text.startswith(terminator, self._pos):
+            return None
+        return self._parse_binary(_ADDITIVE_PRECEDENCE)
+
+    def _parse_primary(self) -> Expr:
+        """Parse primary expression selected by its leading character."""
+        parse = self._PRIMARY_PARSERS.get(self._text[self._pos : self._pos + 1])
+        if parse is None:
+            raise self._error("expression")
+        return parse(self)
+
+    def _parse_dot_expression(self) -> Expr:
+        """Parse dot-rooted path expression head."""
+        self._pos += 1
+        name = self._consume_identifier()
+        if name is not None:
+            return FieldAccess(Identity(), name)
+        if self._text.startswith("[", self._pos):
+            return self._parse_bracket_postfix(Identity())
+        self._skip_whitespace()
+        return Identity()
+
+    def _parse_grouped(self) -> Expr:
+        """Parse parenthesized expression, collapsing redundant nested parentheses."""
+        self._expect_symbol("(")
+        inner = self._parse_pipe()
+        self._expect_symbol(")")
+        return inner if isinstance(inner, Group) else Group(inner)
+
+    def _parse_fold(self) -> Expr:
+        """Parse stream fold expression `[subquery]`."""
+        self._expect_symbol("[")
+        if self._match_symbol("]"):
+            return Fold(None)
+        inner = self._parse_pipe()
+        self._expect_symbol("]")
+        return Fold(inner)
 
-    return parser
+    def _parse_named(self) -> Expr:
+        """Parse conditional, keyword literal, or function call starting with a name."""
+        name = self._expect_identifier()
+        if name == "if":
+            return self._parse_if_else()
+        literal = _KEYWORD_LITERALS.get(name)
+        if literal is not None:
+            return literal
+        return self._parse_function_call(name)
+
+    def _parse_function_call(self, name: str) -> Expr:
+        """Parse known function call with optional parenthesized argument."""
+        if name not in KNOWN_FUNCTIONS:
+            raise QueryParseError(
+                f"Unknown function: {name}. Available functions: {_AVAILABLE_FUNCTIONS}",
+            )
+        if not self._match_symbol("("):
+            return FunctionCall(name, None)
+        argument = self._parse_pipe()
+        self._expect_symbol(")")
+        return FunctionCall(name, argument)
+
+    def _parse_if_else(self) -> Expr:
+        """Parse conditional tail following an `if` or `elif` keyword."""
+        condition = self._parse_pipe()
+        self._expect_keyword("then")
+        then_expr = self._parse_pipe()
+        if self._match_keyword("elif"):
+            return IfElse(condition, then_expr, self._parse_if_else())
+        self._expect_keyword("else")
+        return IfElse(condition, then_expr, self._parse_pipe())
+
+    def _parse_variable(self) -> Expr:
+        """Parse `$name` variable reference."""
+        self._expect_symbol("$")
+        return Variable(self._expect_identifier())
+
+    def _parse_number(self) -> Expr:
+        """Parse integer or decimal number literal."""
+        number = self._consume_pattern(_NUMBER_PATTERN)
+        if number is None:
+            raise self._error("number")
+        if "." in number:
+            return NumberLiteral(float(number))
+        value = int(number)
+        if value < len(_SMALL_INTEGER_LITERALS):
+            return _SMALL_INTEGER_LITERALS[value]
+        return NumberLiteral(value)
+
+    def _parse_string(self) -> Expr:
+        """Parse double-quoted string literal."""
+        token = self._consume_pattern(_STRING_PATTERN)
+        if token is None:
+            raise self._error("string")
+        return StringLiteral(_decode_string(token))
+
+    _PRIMARY_PARSERS: ClassVar[dict[str, Callable[[_QueryParser], Expr]]] = {
+        ".": _parse_dot_expression,
+        "(": _parse_grouped,
+        "[": _parse_fold,
+        "$": _parse_variable,
+        '"': _parse_string,
+        **dict.fromkeys(string.digits, _parse_number),
+        **dict.fromkeys(string.ascii_letters + "_", _parse_named),
+    }
 
 
-QUERY_PARSER = _make_parser()
+def parse_query(query: str) -> Expr:
+    """Parse query text into an AST expression."""
+    trivial = _TRIVIAL_QUERIES.get(query.strip())
+    if trivial is not None:
+        return trivial
+    return _parse_query_impl(query)
 
 
 @lru_cache(maxsize=256)
-def parse_query(query: str) -> Expr:
-    """Parse query text into an AST expression."""
+def _parse_query_impl(query: str) -> Expr:
+    """Run the full parser over query text, memoized per query string."""
     try:
-        result = QUERY_PARSER.parse(query)
-    except ParseError as exc:
+        return _QueryParser(query).parse()
+    except _QuerySyntaxError as exc:
         raise QueryParseError(_format_parse_error(query, exc)) from exc
-    if isinstance(result, Expr):
-        return result
-    raise QueryParseError("Parser did not produce an expression")
@@ -7,7 +7,7 @@ import logging
 from typing import TYPE_CHECKING
 
 from org.query.engine.compiler import compile_query_text
-from org.query.engine.interpreter import EvalContext, Stream
+from org.query.engine.interpreter import EvalContext
 
 
 if TYPE_CHECKING:
@@ -58,4 +58,4 @@ def run_query(
     query_text = build_query_text_from_stages(stages)
     logger.info("Query: %s", query_text)
     compiled_query = compile_query_text(query_text)
-    return list(compiled_query(Stream(inputs), EvalContext(context_vars)))
+    return list(compiled_query(list(inputs), EvalContext(context_vars)))
@@ -163,6 +163,38 @@ def test_prepare_output_falls_back_to_plain_when_not_mapped() -> None:
     assert console.renderables == []
 
 
+def test_print_prepared_output_batches_consecutive_plain_writes() -> None:
+    """Consecutive plain writes should be emitted together around renderables."""
+    console = _FakeConsole()
+    prepared_output = output_format.PreparedOutput(
+        operations=(
+            output_format.OutputOperation(kind="plain_write", text="first"),
+            output_format.OutputOperation(kind="plain_write", text="second"),
+            output_format.OutputOperation(kind="console_print", renderable="marker"),
+            output_format.OutputOperation(kind="plain_write", text="third"),
+        ),
+    )
+
+    output_format.print_prepared_output(cast("Console", console), prepared_output)
+
+    assert console.file.getvalue() == "first\nsecond\nthird\n"
+    assert console.renderables == ["marker"]
+
+
+def test_prepare_output_skips_highlighting_for_oversized_text(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Text above the highlighting limit should be written plainly."""
+    console = _FakeConsole()
+    monkeypatch.setattr(output_format, "_HIGHLIGHT_MAX_CHARS", 4)
+    prepared_output = output_format._prepare_output("# title", True, "gfm", "monokai")
+
+    output_format.print_prepared_output(cast("Console", console), prepared_output)
+
+    assert console.file.getvalue() == "# title\n"
+    assert console.renderables == []
+
+
 def test_prepare_output_falls_back_to_binary_write_on_decode_error() -> None:
     """Binary pandoc output should be emitted as raw bytes."""
     console = _FakeConsole()
@@ -201,6 +233,22 @@ def test_pandoc_query_formatter_uses_syntax_when_color_enabled(
     assert syntax.word_wrap is True
 
 
+def test_org_query_formatter_highlights_all_values_in_one_syntax() -> None:
+    """Org query formatter should highlight all org values as one document."""
+    console = _FakeConsole()
+    formatter = query_command.OrgQueryOutputFormatter()
+    headings: list[object] = list(org_parser.loads("* TODO First\n* TODO Second\n"))
+
+    prepared_output = formatter.prepare(headings, cast("Console", console), True, "monokai")
+    output_format.print_prepared_output(cast("Console", console), prepared_output)
+
+    assert len(console.renderables) == 1
+    syntax = console.renderables[0]
+    assert isinstance(syntax, Syntax)
+    assert syntax.code.count("# unknown\n") == 2
+    assert "First\n\n# unknown\n* TODO Second" in syntax.code
+
+
 def test_json_query_formatter_uses_json_syntax_when_color_enabled() -> None:
     """JSON query formatter should syntax-highlight JSON output with color."""
     console = _FakeConsole()
@@ -218,6 +266,18 @@ def test_json_query_formatter_uses_json_syntax_when_color_enabled() -> None:
     assert syntax.word_wrap is True
 
 
+def test_json_query_formatter_streams_plain_json_without_color() -> None:
+    """JSON query formatter should write JSON straight to the stream without color."""
+    console = _FakeConsole()
+    formatter = query_command.JsonQueryOutputFormatter()
+
+    prepared_output = formatter.prepare([{"ok": True}], cast("Console", console), False, "monokai")
+    output_format.print_prepared_output(cast("Console", console), prepared_output)
+
+    assert console.file.getvalue() == '{"ok": true}\n'
+    assert console.renderables == []
+
+
 def test_pandoc_tasks_formatter_uses_syntax_when_color_enabled(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -404,6 +464,71 @@ def test_to_json_compatible_serializes_generic_element_with_type() -> None:
     assert result["value"] == "Doc"
 
 
+class _ConditionalKeyword(Keyword):
+    """Keyword whose extra attribute is readable only for some instances."""
+
+    @property
+    def conditional(self) -> object:
+        """Return a per-instance value, fail, or return a callable depending on the key."""
+        if self.key == "BROKEN":
+            raise ValueError("unreadable")
+        if self.key == "CALLABLE":
+            return str.lower
+        return self.key.lower()
+
+
+def test_to_json_compatible_reads_generic_element_fields_per_instance() -> None:
+    """Unreadable or callable attributes should be skipped per instance, not per type."""
+    keywords = [
+        _ConditionalKeyword(key="FIRST", value="a"),
+        _ConditionalKeyword(key="BROKEN", value="b"),
+        _ConditionalKeyword(key="CALLABLE", value="c"),
+        _ConditionalKeyword(key="LAST", value="d"),
+    ]
+
+    result = output_format._to_json_compatible(keywords)
+
+    assert isinstance(result, list)
+    assert [item.get("conditional", "<skipped>") for item in result] == [
+        "first",
+        "<skipped>",
+        "<skipped>",
+        "last",
+    ]
+
+
+def test_exported_org_fields_are_cached_per_concrete_type() -> None:
+    """Field names should be resolved once per type and reused for later instances."""
+    heading = next(iter(org_parser.loads("* TODO Task\n")))
+    first = Keyword(key="TITLE", value="Doc")
+    second = Keyword(key="AUTHOR", value="Me")
+
+    keyword_fields = output_format._exported_org_fields(first)
+
+    assert output_format._EXPORTED_FIELDS_BY_TYPE[Keyword] is keyword_fields
+    assert output_format._exported_org_fields(second) is keyword_fields
+    assert output_format._exported_org_fields(heading) is output_format._NODE_EXPORTED_FIELDS
+    second_result = output_format._to_json_compatible(second)
+    assert isinstance(second_result, dict)
+    assert second_result["key"] == "AUTHOR"
+    assert second_result["value"] == "Me"
+
+
+def test_to_json_compatible_serializes_repeated_timestamp_references_fully() -> None:
+    """A timestamp referenced twice should serialize to the same object in both places."""
+    heading = next(iter(org_parser.loads("* TODO Task\nDEADLINE: <2025-01-02 Thu>\n")))
+    assert heading.deadline is not None
+    assert any(timestamp is heading.deadline for timestamp in heading.timestamps)
+
+    result = output_format._to_json_compatible(heading)
+
+    assert isinstance(result, dict)
+    deadline = result["deadline"]
+    assert isinstance(deadline, dict)
+    assert deadline["type"] == "Timestamp"
+    assert result["timestamps"] == [deadline]
+
+
 def test_to_json_compatible_keeps_properties_as_mapping() -> None:
     """Properties should remain mapping-like JSON objects."""
     heading = next(iter(org_parser.loads("* Task\n:PROPERTIES:\n:key: 23\n:END:\n")))
@@ -413,6 +538,13 @@ def test_to_json_compatible_keeps_properties_as_mapping() -> None:
     assert result == {"key": "23"}
 
 
+def test_to_json_compatible_serializes_collections_as_arrays() -> None:
+    """Concrete collections and generic iterables should serialize as JSON arrays."""
+    assert output_format._to_json_compatible((1, "a")) == [1, "a"]
+    assert output_format._to_json_compatible(frozenset({2})) == [2]
+    assert output_format._to_json_compatible(value for value in (3, 4)) == [3, 4]
+
+
 def test_json_tasks_formatter_uses_json_syntax_when_color_enabled() -> None:
     """JSON tasks formatter should syntax-highlight JSON output with color."""
     console = _FakeConsole()
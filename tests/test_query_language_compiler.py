@@ -2,46 +2,96 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import pytest
 
 import org.query.engine.parser as parser_module
 from org.query.engine.ast import NumberLiteral
 from org.query.engine.compiler import compile_expr, compile_query_text
-from org.query.engine.interpreter import EvalContext, Stream
-
-
-if TYPE_CHECKING:
-    import pytest
+from org.query.engine.interpreter import EvalContext, evaluate_expr
 
 
 def test_compile_expr_returns_executable_callable() -> None:
     """compile_expr should execute the provided AST expression."""
     compiled = compile_expr(NumberLiteral(42))
-    result = compiled(Stream([None]), EvalContext({}))
+    result = compiled([None], EvalContext({}))
     assert result == [42]
 
 
 def test_compile_query_text_parses_and_executes_expression() -> None:
     """compile_query_text should parse query text and run the result."""
     compiled = compile_query_text(".[] | .title_text")
-    result = compiled(Stream([[{"title_text": "Task"}]]), EvalContext({}))
+    result = compiled([[{"title_text": "Task"}]], EvalContext({}))
     assert result == ["Task"]
 
 
+def test_compile_expr_specializes_structural_nodes() -> None:
+    """Compiled pipes, groups, iteration and field access should match evaluation."""
+    query = "(.[] | .items[]) | .name"
+    compiled = compile_query_text(query)
+    stream: list[object] = [[{"items": [{"name": "a"}, {"name": "b"}]}, {"items": []}]]
+
+    result = compiled(stream, EvalContext({}))
+
+    assert result == ["a", "b"]
+    assert type(result) is list
+    assert result == evaluate_expr(parser_module.parse_query(query), stream, EvalContext({}))
+
+
+def test_compile_query_text_memoizes_compiled_queries() -> None:
+    """compile_query_text should reuse the compiled callable for identical query text."""
+    compile_query_text.cache_clear()
+
+    assert compile_query_text(".[] | .title_text") is compile_query_text(".[] | .title_text")
+
+
 def test_parse_query_memoizes_repeated_queries(monkeypatch: pytest.MonkeyPatch) -> None:
     """parse_query should only parse identical query text once per process."""
-    parser_module.parse_query.cache_clear()
+    compile_query_text.cache_clear()
+    parser_module._parse_query_impl.cache_clear()
     calls = 0
-    original_parse = parser_module.QUERY_PARSER.parse
+    original_parse = parser_module._QueryParser.parse
 
-    def counted_parse(query: str) -> object:
+    def counted_parse(self: parser_module._QueryParser) -> object:
         nonlocal calls
         calls += 1
-        return original_parse(query)
+        return original_parse(self)
 
-    monkeypatch.setattr(parser_module.QUERY_PARSER, "parse", counted_parse)
+    monkeypatch.setattr(parser_module._QueryParser, "parse", counted_parse)
 
     compile_query_text(".[] | .title_text")
     compile_query_text(".[] | .title_text")
 
     assert calls == 1
+
+
+def test_compile_expr_specializes_operators_and_function_calls() -> None:
+    """Compiled literals, binary operators and function calls should match evaluation."""
+    query = "(.[] | select(. > 1) | . * 10 + 1) | reverse"
+    compiled = compile_query_text(query)
+    stream: list[object] = [[1, 2, 3]]
+
+    result = compiled(stream, EvalContext({}))
+
+    assert result == [31, 21]
+    assert result == evaluate_expr(parser_module.parse_query(query), stream, EvalContext({}))
+
+
+@pytest.mark.parametrize(
+    ("query", "expected"),
+    [
+        (".[] | . == 2 or 1 / (. - 2) > 0", [False, True, True]),
+        (".[] | . != 2 and 1 / (. - 2) > 0", [False, False, True]),
+    ],
+)
+def test_compile_boolean_operators_short_circuit_per_item(
+    query: str,
+    expected: list[object],
+) -> None:
+    """Compiled and/or should skip the right operand when the left decides the item."""
+    compiled = compile_query_text(query)
+    stream: list[object] = [[1, 2, 3]]
+
+    result = compiled(stream, EvalContext({}))
+
+    assert result == expected
+    assert result == evaluate_expr(parser_module.parse_query(query), stream, EvalContext({}))
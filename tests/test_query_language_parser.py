@@ -4,13 +4,17 @@ from __future__ import annotations
 
 import pytest
 
+import org.query.engine.parser as parser_module
 from org.query.engine.ast import (
     AsBinding,
     BinaryOp,
+    BoolLiteral,
     DictAssignment,
     FieldAccess,
     Fold,
     FunctionCall,
+    Group,
+    Identity,
     IfElse,
     LetBinding,
     NoneLiteral,
@@ -108,6 +112,23 @@ def test_parse_field_comparison_shape() -> None:
     assert isinstance(expr.left, FieldAccess)
 
 
+def test_parse_binary_precedence_shape() -> None:
+    """Parser should bind tighter operators first and associate chains to the left."""
+    expr = parse_query("1 - 2 - 3 * 4 > 0 and true")
+    assert isinstance(expr, BinaryOp)
+    assert expr.operator == "and"
+    comparison = expr.left
+    assert isinstance(comparison, BinaryOp)
+    assert comparison.operator == ">"
+    subtraction = comparison.left
+    assert isinstance(subtraction, BinaryOp)
+    assert subtraction.operator == "-"
+    assert isinstance(subtraction.left, BinaryOp)
+    assert subtraction.left.operator == "-"
+    assert isinstance(subtraction.right, BinaryOp)
+    assert subtraction.right.operator == "*"
+
+
 def test_parse_slice_query_shape() -> None:
     """Parser should build slice node for slicing queries."""
     expr = parse_query(".[0:10]")
@@ -159,6 +180,13 @@ def test_parse_unary_minus_shape() -> None:
     assert expr.left.value == 0
 
 
+def test_parse_nested_parentheses_collapse_to_single_group() -> None:
+    """Parser should not stack Group nodes for redundant parentheses."""
+    expr = parse_query("(((.todo)))")
+    assert isinstance(expr, Group)
+    assert isinstance(expr.expr, FieldAccess)
+
+
 def test_parse_fold_shape() -> None:
     """Parser should parse fold expressions."""
     expr = parse_query("[ .[] | .title_text ]")
@@ -222,6 +250,35 @@ def test_parse_sequence_shape() -> None:
     assert isinstance(expr, Sequence)
 
 
+def test_parse_trivial_queries_skip_full_parse(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Identity and keyword literal queries should return shared nodes without parsing."""
+    parser_module._parse_query_impl.cache_clear()
+    calls = 0
+    original_parse = parser_module._QueryParser.parse
+
+    def counted_parse(self: parser_module._QueryParser) -> object:
+        nonlocal calls
+        calls += 1
+        return original_parse(self)
+
+    monkeypatch.setattr(parser_module._QueryParser, "parse", counted_parse)
+
+    identity = parse_query(".")
+    true_literal = parse_query(" true ")
+    false_literal = parse_query("false")
+    none_literal = parse_query("null")
+
+    assert calls == 0
+    assert isinstance(identity, Identity)
+    assert true_literal == BoolLiteral(True)
+    assert false_literal == BoolLiteral(False)
+    assert isinstance(none_literal, NoneLiteral)
+    assert identity is parser_module._TRIVIAL_QUERIES["."]
+    assert true_literal is parser_module._TRIVIAL_QUERIES["true"]
+    assert false_literal is parser_module._TRIVIAL_QUERIES["false"]
+    assert none_literal is parser_module._TRIVIAL_QUERIES["null"]
+
+
 def test_parse_none_literal_is_not_identifier_string() -> None:
     """null should parse as NoneLiteral in comparisons."""
     expr = parse_query(".todo != null")
@@ -276,3 +333,20 @@ def test_parse_unknown_function_lists_available_functions() -> None:
     assert "Unknown function: unknown_fn." in message
     assert "Available functions:" in message
     assert "select" in message
+
+
+@pytest.mark.parametrize(
+    ("query", "expected"),
+    [
+        ('"plain"', "plain"),
+        (r'"say \"hi\"\n"', 'say "hi"\n'),
+        (r'"\\d+\.org"', r"\d+\.org"),
+        (r'"tab\there"', "tab\there"),
+        (r'"caf\u00e9"', "café"),
+    ],
+)
+def test_parse_string_literal_escapes(query: str, expected: str) -> None:
+    """String literals should decode escapes and keep unknown escapes verbatim."""
+    expr = parse_query(query)
+    assert isinstance(expr, StringLiteral)
+    assert expr.value == expected
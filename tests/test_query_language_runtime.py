@@ -16,7 +16,7 @@ from org_parser.time import Clock, Timestamp
 import org.query.engine.interpreter as runtime_module
 from org.query.engine.compiler import compile_query_text
 from org.query.engine.errors import QueryRuntimeError
-from org.query.engine.interpreter import EvalContext, Stream
+from org.query.engine.interpreter import EvalContext
 from tests.conftest import node_from_org
 
 
@@ -28,7 +28,7 @@ def _execute(
     compiled = compile_query_text(query)
     context_vars = {} if variables is None else variables
     context = EvalContext(context_vars)
-    return compiled(Stream([nodes]), context)
+    return compiled([nodes], context)
 
 
 def _sample_nodes() -> list[object]:
@@ -521,7 +521,7 @@ def test_runtime_let_binding_without_previous_value_clears_variable_after_body()
     """let should remove newly introduced variables after body evaluation."""
     compiled = compile_query_text('let "v" as $temp in $temp')
     context = EvalContext({})
-    result = compiled(Stream([None]), context)
+    result = compiled([None], context)
 
     assert result == ["v"]
     assert "temp" not in context.variables
@@ -683,10 +683,10 @@ def test_runtime_fold_function_collects_substream_before_later_stages() -> None:
 
 
 def test_runtime_returns_stream_type() -> None:
-    """Compiled queries should return Stream instances."""
+    """Compiled queries should return plain list streams."""
     compiled = compile_query_text(".[] | .title_text")
-    result = compiled(Stream([_sample_nodes()]), EvalContext({}))
-    assert isinstance(result, Stream)
+    result = compiled([_sample_nodes()], EvalContext({}))
+    assert type(result) is list
 
 
 def test_runtime_iterate_requires_collection() -> None:
@@ -910,7 +910,7 @@ def test_runtime_binary_broadcast_requires_compatible_stream_lengths() -> None:
     """Binary operators should reject incompatible stream lengths."""
     compiled = compile_query_text(".[] + .")
     with pytest.raises(QueryRuntimeError):
-        compiled(Stream([[1, 2], [3]]), EvalContext({}))
+        compiled([[1, 2], [3]], EvalContext({}))
 
 
 def test_runtime_tuple_expr_skips_items_when_part_yields_empty_stream() -> None:
@@ -923,7 +923,7 @@ def test_runtime_unique_length_and_reverse_variants() -> None:
     """Utility functions should handle mixed stream and collection inputs."""
     unique_result = _execute(".[0][] | unique", [[1, 1, 2, 2, 3]], None)
     reverse_collection = _execute(".[0] | reverse", [[1, 2, 3]], None)
-    reverse_stream = compile_query_text("reverse")(Stream([1, 2, 3]), EvalContext({}))
+    reverse_stream = compile_query_text("reverse")([1, 2, 3], EvalContext({}))
     length_result = _execute(".[] | length", [[1], {"a": 1}, {1, 2}, "xy", 10], None)
 
     assert unique_result == [1, 2, 3]
@@ -1024,6 +1024,15 @@ def test_runtime_dict_assignment_with_dynamic_key_expression() -> None:
     ]
 
 
+def test_runtime_literal_subexpressions_apply_to_every_item() -> None:
+    """Literal keys, indexes, slice bounds and conditions should apply to each item."""
+    values = [[1, 2, 3], [4, 5]]
+
+    assert _execute(".[] | .[0]", values, None) == [1, 4]
+    assert _execute(".[] | .[(1):]", values, None) == [[2, 3], [5]]
+    assert _execute('.[] | if (true) then length else "none"', values, None) == [3, 2]
+
+
 def test_runtime_dict_assignment_accepts_richtext_keys() -> None:
     """Dictionary assignment should accept RichText keys."""
     values = [{"k": RichText("done"), "meta": {}}]
@@ -1242,7 +1251,7 @@ def test_runtime_unsupported_expression_type_raises_runtime_error() -> None:
 
     compiled = compile_expr(Expr())
     with pytest.raises(QueryRuntimeError):
-        compiled(Stream([None]), EvalContext({}))
+        compiled([None], EvalContext({}))
 
 
 def test_runtime_unsupported_function_name_raises_runtime_error() -> None:
@@ -1252,7 +1261,7 @@ def test_runtime_unsupported_function_name_raises_runtime_error() -> None:
 
     compiled = compile_expr(FunctionCall("unknown", None))
     with pytest.raises(QueryRuntimeError):
-        compiled(Stream([None]), EvalContext({}))
+        compiled([None], EvalContext({}))
 
 
 def test_runtime_broadcast_with_singleton_side_variants() -> None:
@@ -1260,8 +1269,8 @@ def test_runtime_broadcast_with_singleton_side_variants() -> None:
     left_singleton = compile_query_text("1 + .")
     right_singleton = compile_query_text(". + 1")
 
-    assert left_singleton(Stream([2, 3]), EvalContext({})) == [3, 4]
-    assert right_singleton(Stream([2, 3]), EvalContext({})) == [3, 4]
+    assert left_singleton([2, 3], EvalContext({})) == [3, 4]
+    assert right_singleton([2, 3], EvalContext({})) == [3, 4]
 
 
 def test_runtime_temporal_type_function_and_constructors() -> None: